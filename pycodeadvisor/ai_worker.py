@@ -1,20 +1,111 @@
-from typing import Dict, Any
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pycodeadvisor.models import ErrorEvent, Recommendation, RecommendationBuilder
-from pycodeadvisor.providers import OpenAIProvider, AnthropicProvider, GoogleProvider
+from pycodeadvisor.response_cache import ResponseCache
+from pycodeadvisor.semantic_cache import SemanticCache
+
+
+# Parsed AI responses keyed by a hash of (provider, model, system prompt, prompt), oldest first
+_RESPONSE_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = 512
+
+# Static instructions, sent as the system prompt so providers can cache this shared prefix
+_SYSTEM_PROMPT = """You are a Python code analysis expert. Provide clear, actionable advice for fixing code errors.
+
+Fix the Python error you are given with one sentence each, using exactly this format:
+EXPLANATION: [What's wrong in one sentence]
+SUGGESTED FIX: [How to fix it in one sentence]
+CONFIDENCE: [0.0-1.0]"""
+
+_BATCH_SYSTEM_PROMPT = """You are a Python code analysis expert. Provide clear, actionable advice for fixing code errors.
+
+Fix each of the numbered Python errors you are given with one sentence each.
+Answer every error in order using exactly this format:
+=== RESULT 1 ===
+EXPLANATION: [What's wrong in one sentence]
+SUGGESTED FIX: [How to fix it in one sentence]
+CONFIDENCE: [0.0-1.0]
+=== RESULT 2 ===
+..."""
+
+# Per-error user prompt templates, filled in with str.format
+_PROMPT_TEMPLATE = """ERROR: {error_type} - {message}
+LINE: {line_number}"""
+
+_BATCH_ERROR_TEMPLATE = """ERROR {number}: {error_type} - {message}
+LINE: {line_number}"""
+
+# Complete EXPLANATION / SUGGESTED FIX / CONFIDENCE answer, each label at the start of a line.
+# The confidence must be a bare number; anything else ("85%", "8/10") takes the line parser's default
+_RESPONSE_RE = re.compile(
+    r"^[ \t]*EXPLANATION:\s*(.*?)\s*^[ \t]*SUGGESTED FIX:\s*(.*?)\s*^[ \t]*CONFIDENCE:[ \t]*(\d*\.?\d+)[ \t]*$",
+    re.MULTILINE | re.DOTALL)
+_LINE_BREAK_RE = re.compile(r"\s*\n\s*")
+
+# Canned answers for syntax errors whose cause is fully described by the message.
+# Each rule is (message pattern, explanation, suggested fix, confidence); the text
+# may refer to pattern groups as \1. Only messages the interpreter raises are covered:
+# "expected ':'", unclosed brackets and unterminated strings are also what
+# detect_line_patterns guesses from single lines, so those always go to the provider.
+_RULES = [
+    (re.compile(r"unexpected EOF while parsing"),
+     "The file ends while a bracket, string or block is still open.",
+     "Close the open bracket, string or block before the end of the file.",
+     0.9),
+    (re.compile(r"expected an indented block"),
+     "A block header such as def, if or for must be followed by an indented body.",
+     "Indent the body under the header, or add 'pass' if the block should be empty.",
+     0.95),
+    (re.compile(r"unexpected indent"),
+     "This line is indented more than the code around it without opening a new block.",
+     "Align the line with the surrounding code.",
+     0.95),
+    (re.compile(r"unindent does not match any outer indentation level"),
+     "This line's indentation does not line up with any enclosing block.",
+     "Use the same indentation as the block the line belongs to, and avoid mixing tabs and spaces.",
+     0.95),
+    (re.compile(r"Missing parentheses in call to '(\w+)'"),
+     "'\\1' is a function in Python 3 and must be called with parentheses.",
+     "Wrap the arguments in parentheses, e.g. \\1(...).",
+     0.98),
+]
+
+# Response labels mapped to the section they start
+_SECTION_LABELS = {
+    "EXPLANATION": "explanation",
+    "SUGGESTED FIX": "suggested_fix",
+    "CONFIDENCE": "confidence",
+}
+
+# Errors sent to the provider in one request by analyze_errors
+_MAX_BATCH_SIZE = 5
+_RESULT_MARKER_RE = re.compile(r"^\s*=== RESULT (\d+) ===\s*$", re.MULTILINE)
 
 
 class AIWorker:
     """Main AI analysis worker with multi-provider support"""
     
-    def __init__(self, provider_config: Dict[str, Any]):
+    def __init__(self, provider_config: Dict[str, Any], semantic_cache: bool = False,
+                 max_concurrency: int = 5, response_cache: Optional[ResponseCache] = None):
         """
         Initialize AIWorker with provider configuration
         
         Args:
             provider_config: Dictionary with 'type', 'api_key', and optional 'model'
                 Example: {'type': 'openai', 'api_key': 'sk-...', 'model': 'gpt-4'}
+            semantic_cache: Reuse responses for similar errors via local embeddings
+                (requires the optional 'semantic' extra)
+            max_concurrency: Maximum provider requests in flight for analyze_errors_async
+            response_cache: Persistent cache that keeps responses between runs
         """
         self.provider = self._create_provider(provider_config)
+        self.semantic_cache = SemanticCache() if semantic_cache else None
+        self.max_concurrency = max_concurrency
+        self.response_cache = response_cache
     
     def _create_provider(self, config: Dict[str, Any]):
         """Factory method to create appropriate provider"""
@@ -25,14 +116,9 @@ class AIWorker:
         if not api_key:
             raise ValueError("API key is required")
         
-        if provider_type == "openai":
-            return OpenAIProvider(api_key, model) if model else OpenAIProvider(api_key)
-        elif provider_type == "anthropic":
-            return AnthropicProvider(api_key, model) if model else AnthropicProvider(api_key)
-        elif provider_type == "google":
-            return GoogleProvider(api_key, model) if model else GoogleProvider(api_key)
-        else:
-            raise ValueError(f"Unsupported provider: {provider_type}. Supported: openai, anthropic, google")
+        # Providers are imported on first use so commands that skip AI never load the HTTP stack
+        from pycodeadvisor.providers import create_provider
+        return create_provider(provider_type, api_key, model)
     
     def analyze_error(self, error_event: ErrorEvent) -> Recommendation:
         """
@@ -44,83 +130,328 @@ class AIWorker:
         Returns:
             Recommendation object with AI-generated advice
         """
-        # Build prompt from error context
-        prompt = self._build_prompt(error_event)
+        return self.analyze_errors([error_event])[0]
+    
+    def analyze_errors(self, error_events: List[ErrorEvent]) -> List[Recommendation]:
+        """
+        Analyze several errors, sending uncached ones to the provider in batched requests
+        
+        Args:
+            error_events: ErrorEvents from syntax analysis
+            
+        Returns:
+            Recommendation objects in the same order as error_events
+        """
+        parsed_responses, pending = self._lookup_cached_responses(error_events)
+        
+        for batch in self._split_batches(pending):
+            batch_events = [error_events[index] for index, _ in batch]
+            batch_prompts = [prompt for _, prompt in batch]
+            results = self._request_batch(batch_events, batch_prompts)
+            self._apply_batch_results(error_events, parsed_responses, batch, results)
+        
+        return [self._build_recommendation(error_event, parsed_response)
+                for error_event, parsed_response in zip(error_events, parsed_responses)]
+    
+    async def analyze_error_async(self, error_event: ErrorEvent) -> Recommendation:
+        """Async version of analyze_error"""
+        result = (await self.analyze_errors_async([error_event]))[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    async def analyze_errors_async(self, error_events: List[ErrorEvent],
+                                   semaphore: Optional[asyncio.Semaphore] = None) -> List[Union[Recommendation, Exception]]:
+        """
+        Analyze several errors like analyze_errors, running the provider requests concurrently
+        
+        Args:
+            error_events: ErrorEvents from syntax analysis
+            semaphore: Limits requests in flight; share one between calls to apply a
+                global limit. Defaults to a new semaphore of max_concurrency.
+            
+        Returns:
+            Recommendation objects in the same order as error_events; errors whose
+            request failed get the exception instead
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        parsed_responses, pending = self._lookup_cached_responses(error_events)
+        batches = self._split_batches(pending)
+        
+        # A failed batch only affects its own errors; the others keep their results
+        all_results = await asyncio.gather(
+            *(self._request_batch_async([error_events[index] for index, _ in batch],
+                                        [prompt for _, prompt in batch], semaphore)
+              for batch in batches),
+            return_exceptions=True)
+        for batch, results in zip(batches, all_results):
+            self._apply_batch_results(error_events, parsed_responses, batch, results)
+        
+        return [parsed_response if isinstance(parsed_response, Exception)
+                else self._build_recommendation(error_event, parsed_response)
+                for error_event, parsed_response in zip(error_events, parsed_responses)]
+    
+    def analyze_errors_in_batch_job(self, error_events: List[ErrorEvent],
+                                    poll_interval: float = 5.0) -> List[Recommendation]:
+        """
+        Analyze several errors through the provider's asynchronous batch API
+        
+        Batch jobs cost less but may take minutes to complete, so this suits
+        latency-tolerant runs such as CI.
+        
+        Args:
+            error_events: ErrorEvents from syntax analysis
+            poll_interval: Seconds to wait between batch status checks
+            
+        Returns:
+            Recommendation objects in the same order as error_events
+        """
+        if not self.provider.supports_batch:
+            raise ValueError(f"{type(self.provider).__name__} does not support batch jobs")
+        
+        parsed_responses, pending = self._lookup_cached_responses(error_events)
+        
+        if pending:
+            # One request per error, identified by its index
+            batch_id = self.provider.submit_batch(_SYSTEM_PROMPT, {str(index): prompt for index, prompt in pending})
+            
+            responses = self.provider.get_batch_results(batch_id)
+            while responses is None:
+                time.sleep(poll_interval)
+                responses = self.provider.get_batch_results(batch_id)
+            
+            for index, prompt in pending:
+                if str(index) in responses:
+                    parsed_responses[index] = self._parse_ai_response(responses[str(index)])
+                    self._store_cached_response(error_events[index], prompt, parsed_responses[index])
+                else:
+                    # Failed requests are reported with the default text and not cached
+                    parsed_responses[index] = self._parse_ai_response("")
         
-        # Get AI response
-        ai_response = self.provider.generate_recommendation(prompt)
+        return [self._build_recommendation(error_event, parsed_response)
+                for error_event, parsed_response in zip(error_events, parsed_responses)]
+    
+    def _lookup_cached_responses(self, error_events: List[ErrorEvent]) -> Tuple[List[Optional[Dict[str, Any]]], List[Tuple[int, str]]]:
+        """Answer errors from the rule table or cache, returning responses and the (index, prompt) pairs still missing"""
+        parsed_responses: List[Optional[Dict[str, Any]]] = [None] * len(error_events)
+        pending = []
+        
+        for index, error_event in enumerate(error_events):
+            parsed_responses[index] = self._match_rule(error_event)
+            if parsed_responses[index] is not None:
+                continue
+            
+            prompt = self._build_prompt(error_event)
+            parsed_responses[index] = self._get_cached_response(error_event, prompt)
+            if parsed_responses[index] is None:
+                pending.append((index, prompt))
         
-        # Parse response into structured data
-        parsed_response = self._parse_ai_response(ai_response)
+        return parsed_responses, pending
+    
+    def _split_batches(self, pending: List[Tuple[int, str]]) -> List[List[Tuple[int, str]]]:
+        """Split pending (index, prompt) pairs into batches of at most _MAX_BATCH_SIZE"""
+        return [pending[start:start + _MAX_BATCH_SIZE] for start in range(0, len(pending), _MAX_BATCH_SIZE)]
+    
+    def _apply_batch_results(self, error_events: List[ErrorEvent], parsed_responses: List[Optional[Dict[str, Any]]],
+                             batch: List[Tuple[int, str]], results: Union[List[Dict[str, Any]], BaseException]):
+        """Cache a batch's parsed responses and fill them into parsed_responses, or record its failure per error"""
+        if isinstance(results, BaseException):
+            if not isinstance(results, Exception):
+                # Cancellation and interpreter exits are not request failures
+                raise results
+            for index, _ in batch:
+                parsed_responses[index] = results
+            return
         
-        # Build recommendation using RecommendationBuilder
+        for (index, prompt), parsed_response in zip(batch, results):
+            self._store_cached_response(error_events[index], prompt, parsed_response)
+            parsed_responses[index] = parsed_response
+    
+    def _build_recommendation(self, error_event: ErrorEvent, parsed_response: Dict[str, Any]) -> Recommendation:
+        """Build a Recommendation for an error from a parsed AI response"""
         builder = RecommendationBuilder()
         recommendation = (builder
             .set_error_event(error_event)
             .set_explanation(parsed_response['explanation'])
             .set_suggested_fix(parsed_response['suggested_fix'])
             .set_confidence_score(parsed_response['confidence'])
+            .set_source(parsed_response.get('source', 'ai'))
             .build())
         
         return recommendation
     
+    def _request_batch(self, error_events: List[ErrorEvent], prompts: List[str]) -> List[Dict[str, Any]]:
+        """Get parsed responses for several errors from a single provider request"""
+        if len(prompts) == 1:
+            return [self._parse_ai_response(self.provider.generate_recommendation(_SYSTEM_PROMPT, prompts[0]))]
+        
+        ai_response = self.provider.generate_recommendation(_BATCH_SYSTEM_PROMPT, self._build_batch_prompt(error_events))
+        results = self._split_batch_response(ai_response)
+        
+        parsed_responses = []
+        for number, prompt in enumerate(prompts, 1):
+            if number in results:
+                parsed_responses.append(self._parse_ai_response(results[number]))
+            else:
+                # The model skipped this error - ask about it on its own
+                parsed_responses.append(self._parse_ai_response(self.provider.generate_recommendation(_SYSTEM_PROMPT, prompt)))
+        
+        return parsed_responses
+    
+    async def _request_batch_async(self, error_events: List[ErrorEvent], prompts: List[str],
+                                   semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """Async version of _request_batch; every provider request holds a semaphore slot"""
+        async def generate(system: str, prompt: str) -> str:
+            async with semaphore:
+                return await self.provider.agenerate_recommendation(system, prompt)
+        
+        if len(prompts) == 1:
+            return [self._parse_ai_response(await generate(_SYSTEM_PROMPT, prompts[0]))]
+        
+        ai_response = await generate(_BATCH_SYSTEM_PROMPT, self._build_batch_prompt(error_events))
+        results = self._split_batch_response(ai_response)
+        
+        # Ask about any errors the model skipped on their own, concurrently within the limit
+        missing = [number for number in range(1, len(prompts) + 1) if number not in results]
+        retried = await asyncio.gather(*(generate(_SYSTEM_PROMPT, prompts[number - 1]) for number in missing))
+        results.update(zip(missing, retried))
+        
+        return [self._parse_ai_response(results[number]) for number in range(1, len(prompts) + 1)]
+    
+    def _split_batch_response(self, ai_response: str) -> Dict[int, str]:
+        """Split a combined answer on its '=== RESULT k ===' markers into text per error number"""
+        sections = _RESULT_MARKER_RE.split(ai_response)
+        return {int(number): text for number, text in zip(sections[1::2], sections[2::2])}
+    
+    def _match_rule(self, error_event: ErrorEvent) -> Optional[Dict[str, Any]]:
+        """Return the canned response for an error message covered by _RULES, if any"""
+        for pattern, explanation, suggested_fix, confidence in _RULES:
+            match = pattern.search(error_event.message)
+            if match:
+                return {
+                    'explanation': match.expand(explanation),
+                    'suggested_fix': match.expand(suggested_fix),
+                    'confidence': confidence,
+                    'source': 'rule'
+                }
+        
+        return None
+    
+    def _get_cached_response(self, error_event: ErrorEvent, prompt: str) -> Optional[Dict[str, Any]]:
+        """Look up a parsed response for an exact prompt (in memory, then on disk) or, if enabled, a similar error"""
+        cache_key = self._cache_key(prompt)
+        
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            _RESPONSE_CACHE.move_to_end(cache_key)
+            return cached
+        
+        if self.response_cache is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self._remember(cache_key, cached)
+                return cached
+        
+        if self.semantic_cache is not None:
+            return self.semantic_cache.lookup(error_event)
+        
+        return None
+    
+    def _store_cached_response(self, error_event: ErrorEvent, prompt: str, parsed_response: Dict[str, Any]):
+        """Remember a parsed response for later identical or similar errors"""
+        cache_key = self._cache_key(prompt)
+        self._remember(cache_key, parsed_response)
+        
+        if self.response_cache is not None:
+            self.response_cache.put(cache_key, type(self.provider).__name__,
+                                    self.provider.get_model_name(), parsed_response)
+        
+        if self.semantic_cache is not None:
+            self.semantic_cache.store(error_event, parsed_response)
+    
+    def _remember(self, cache_key: str, parsed_response: Dict[str, Any]):
+        """Add a parsed response to the in-memory cache, evicting the oldest entry when full"""
+        _RESPONSE_CACHE[cache_key] = parsed_response
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+    
+    def _cache_key(self, prompt: str) -> str:
+        """Build the response cache key for a single-error prompt sent to the current provider"""
+        provider_key = f"{type(self.provider).__name__}:{self.provider.get_model_name()}"
+        return hashlib.sha256(f"{provider_key}\n{_SYSTEM_PROMPT}\n{prompt}".encode('utf-8')).hexdigest()
+    
     def _build_prompt(self, error_event: ErrorEvent) -> str:
-        prompt = f"""Fix this Python error with one sentence each:
-
-        ERROR: {error_event.error_type} - {error_event.message}
-        LINE: {error_event.line_number}
-
-        EXPLANATION: [What's wrong in one sentence]
-        SUGGESTED FIX: [How to fix it in one sentence]
-        CONFIDENCE: [0.0-1.0]"""
-        return prompt
+        """Build the user prompt for one error; instructions are in _SYSTEM_PROMPT"""
+        return _PROMPT_TEMPLATE.format(
+            error_type=error_event.error_type,
+            message=error_event.message,
+            line_number=error_event.line_number)
+    
+    def _build_batch_prompt(self, error_events: List[ErrorEvent]) -> str:
+        """Build the user prompt listing several numbered errors; instructions are in _BATCH_SYSTEM_PROMPT"""
+        return "\n\n".join(
+            _BATCH_ERROR_TEMPLATE.format(
+                number=number,
+                error_type=error_event.error_type,
+                message=error_event.message,
+                line_number=error_event.line_number)
+            for number, error_event in enumerate(error_events, 1))
     
     def _parse_ai_response(self, response: str) -> Dict[str, Any]:
         """Extract structured information from AI response"""
+        # Well-formed responses are handled by a single regex scan
+        match = _RESPONSE_RE.search(response)
+        if match:
+            explanation, suggested_fix, confidence_text = match.groups()
+            return {
+                'explanation': _LINE_BREAK_RE.sub(" ", explanation) or "Unable to analyze this error",
+                'suggested_fix': _LINE_BREAK_RE.sub(" ", suggested_fix) or "No specific fix suggested",
+                'confidence': max(0.0, min(1.0, float(confidence_text)))
+            }
+        
+        return self._parse_ai_response_lines(response)
+    
+    def _parse_ai_response_lines(self, response: str) -> Dict[str, Any]:
+        """Extract structured information line by line, for responses the regex does not match"""
         lines = response.strip().split('\n')
         
-        explanation = ""
-        suggested_fix = ""
+        # Collect section lines in lists and join once at the end
+        section_parts: Dict[str, List[str]] = {"explanation": [], "suggested_fix": []}
         confidence = 0.5  # default
         
-        current_section = None
+        current_parts = None
         
         for line in lines:
             line = line.strip()
             
-            if line.startswith("EXPLANATION:"):
-                current_section = "explanation"
-                # Extract content after colon on same line
-                content = line.replace("EXPLANATION:", "").strip()
-                if content:
-                    explanation = content
-                continue
-            elif line.startswith("SUGGESTED FIX:"):
-                current_section = "suggested_fix"
-                # Extract content after colon on same line
-                content = line.replace("SUGGESTED FIX:", "").strip()
-                if content:
-                    suggested_fix = content
-                continue
-            elif line.startswith("CONFIDENCE:"):
+            # One partition and dict lookup instead of a startswith check per label
+            label, colon, content = line.partition(':')
+            section = _SECTION_LABELS.get(label) if colon else None
+            
+            if section == "confidence":
                 # Extract confidence value
                 try:
-                    confidence_text = line.replace("CONFIDENCE:", "").strip()
-                    confidence = float(confidence_text)
-                    confidence = max(0.0, min(1.0, confidence))
-                except (ValueError, IndexError):
+                    confidence = max(0.0, min(1.0, float(content.strip())))
+                except ValueError:
                     confidence = 0.5
                 continue
+            elif section is not None:
+                current_parts = section_parts[section]
+                # Extract content after colon on same line
+                content = content.strip()
+                if content:
+                    current_parts[:] = [content]
+                continue
             
             # Add content to current section only if we're in a section
-            if current_section == "explanation" and line:
-                explanation += " " + line
-            elif current_section == "suggested_fix" and line:
-                suggested_fix += " " + line
+            if current_parts is not None and line:
+                current_parts.append(line)
         
         return {
-            'explanation': explanation.strip() or "Unable to analyze this error",
-            'suggested_fix': suggested_fix.strip() or "No specific fix suggested", 
+            'explanation': " ".join(section_parts["explanation"]) or "Unable to analyze this error",
+            'suggested_fix': " ".join(section_parts["suggested_fix"]) or "No specific fix suggested", 
             'confidence': confidence
         }
     
@@ -1,14 +1,35 @@
 import click
+import logging
 from pathlib import Path
+from typing import Dict, List, TYPE_CHECKING
 from pycodeadvisor.syntax_analyzer import SyntaxAnalyzer
 from pycodeadvisor.config import Config
-from pycodeadvisor.ai_worker import AIWorker
+from pycodeadvisor.models import ErrorEvent
+
+# AIWorker pulls in asyncio and the HTTP stack, so commands import it only when AI is used
+if TYPE_CHECKING:
+    from pycodeadvisor.ai_worker import AIWorker
+
+# Confidence lines are styled once; only the percentage changes per error
+_CONF_GREEN = click.style("Confidence: %d%%", fg="green")
+_CONF_YELLOW = click.style("Confidence: %d%%", fg="yellow")
+
+
+class _EchoHandler(logging.Handler):
+    """Write log records to stderr through click, so they follow click's current streams"""
+    
+    def emit(self, record: logging.LogRecord):
+        click.echo(self.format(record), err=True)
 
 
 @click.group()
 def main():
     """PyCodeAdvisor - AI-powered Python code analysis"""
-    pass
+    # Analyzer progress goes to stderr, leaving stdout for results
+    package_logger = logging.getLogger('pycodeadvisor')
+    if not package_logger.handlers:
+        package_logger.addHandler(_EchoHandler())
+        package_logger.setLevel(logging.INFO)
 
 
 @main.command()
@@ -16,29 +37,36 @@ def main():
 @click.option('--no-ai', is_flag=True, help='Skip AI analysis, show syntax errors only')
 @click.option('--provider', help='Override default AI provider (openai, anthropic, google)')
 @click.option('--max-errors', default=10, help='Maximum number of errors to analyze with AI')
-def check(path, no_ai, provider, max_errors):
+@click.option('--semantic-cache', is_flag=True, help='Reuse AI answers for similar errors (requires pycodeadvisor[semantic])')
+@click.option('--batch', is_flag=True, help='Use the provider batch API (cheaper, may take minutes; openai and anthropic)')
+@click.option('--no-cache', is_flag=True, help='Do not read or write the on-disk parse and AI response caches')
+@click.option('--cache-ttl', default=30.0, type=float, help='Days to keep cached AI responses (default: 30)')
+def check(path, no_ai, provider, max_errors, semantic_cache, batch, no_cache, cache_ttl):
     """Analyze Python files for potential issues"""
     try:
         # Run syntax analysis
         analyzer = SyntaxAnalyzer(path)
-        errors = analyzer.analyze_project()
+        analyzer.parse_cache = _open_parse_cache(no_cache, analyzer.project_path)
+        try:
+            errors = analyzer.analyze_project()
+        finally:
+            if analyzer.parse_cache is not None:
+                analyzer.parse_cache.close()
         
         if not errors:
             click.echo("✓ No syntax errors found!")
             return
         
-        # Group errors by file
-        errors_by_file = {}
+        # Group errors by file, keyed by the stored path string so no Path is built per error
+        errors_by_file: Dict[str, List[ErrorEvent]] = {}
         for error in errors:
-            file_path = str(error.file_path)
-            if file_path not in errors_by_file:
-                errors_by_file[file_path] = []
-            errors_by_file[file_path].append(error)
+            errors_by_file.setdefault(error.file_path_str, []).append(error)
         
         click.echo(f"\nFound {len(errors)} syntax errors in {len(errors_by_file)} files")
         
         # Initialize AI worker if needed
         ai_worker = None
+        response_cache = None
         if not no_ai:
             try:
                 config = Config()
@@ -52,58 +80,43 @@ def check(path, no_ai, provider, max_errors):
                         provider_to_use = configured_providers[0]
                     
                     provider_config = config.get_provider_config(provider_to_use)
-                    ai_worker = AIWorker(provider_config)
+                    from pycodeadvisor.ai_worker import AIWorker
+                    response_cache = _open_response_cache(no_cache, cache_ttl)
+                    ai_worker = AIWorker(provider_config, semantic_cache=semantic_cache,
+                                         response_cache=response_cache)
                     click.echo(f"Using AI provider: {provider_to_use}")
                     
+                    if ai_worker.semantic_cache and not ai_worker.semantic_cache.is_available():
+                        click.echo("Semantic cache unavailable. Install with: pip install pycodeadvisor[semantic]")
+                    
             except Exception as e:
                 click.echo(f"AI setup failed: {e}")
                 no_ai = True
         
+        # Limit errors per file for AI analysis
+        errors_to_analyze_by_file = {file_path: file_errors[:max_errors]
+                                     for file_path, file_errors in errors_by_file.items()}
+        
+        # AI analysis for all files at once, with provider requests running concurrently
+        ai_results = {}
+        try:
+            if not no_ai and ai_worker:
+                if batch and not ai_worker.provider.supports_batch:
+                    click.echo(f"Batch jobs are not supported by {provider_to_use}, analyzing errors directly")
+                    batch = False
+                
+                if batch:
+                    click.echo("Analyzing errors in a provider batch job, this may take a few minutes...")
+                ai_results = _analyze_unique_errors(ai_worker, errors_to_analyze_by_file, batch)
+        finally:
+            if response_cache is not None:
+                response_cache.close()
+        
         # Display results grouped by file
         for file_path, file_errors in errors_by_file.items():
-            file_name = Path(file_path).name
-            click.echo(f"\n{file_name} ({len(file_errors)} errors)")
-            click.echo("─" * 40)
-            
-            # Limit errors per file for AI analysis
-            errors_to_analyze = file_errors[:max_errors]
-            if len(file_errors) > max_errors:
-                click.echo(f"Note: Showing first {max_errors} of {len(file_errors)} errors")
-            
-            for i, error in enumerate(errors_to_analyze, 1):
-                click.echo(f"\nError {i}: {error.error_type} at line {error.line_number}")
-                click.echo(f"Message: {error.message}")
-                
-                if error.code_context:
-                    # Show just the error line with context
-                    context = error.get_context_snippet()
-                    # Extract just the highlighted line for brevity
-                    context_lines = context.split('\n')
-                    error_line = next((line for line in context_lines if line.startswith('>>>')), "")
-                    if error_line:
-                        click.echo(f"Code: {error_line}")
-                
-                # AI analysis for this error
-                if not no_ai and ai_worker:
-                    try:
-                        recommendation = ai_worker.analyze_error(error)
-                        
-                        # Clean up explanation and fix text
-                        explanation = recommendation.explanation.strip()
-                        suggested_fix = recommendation.suggested_fix.strip()
-                        
-                        click.echo(f"Explanation: {explanation}")
-                        click.echo(f"Fix: {suggested_fix}")
-                        
-                        # Show confidence with color
-                        confidence_color = "green" if recommendation.is_high_confidence() else "yellow"
-                        click.echo(click.style(f"Confidence: {recommendation.confidence_score:.0%}", fg=confidence_color))
-                        
-                    except Exception as ai_error:
-                        click.echo(f"AI analysis failed: {ai_error}")
-                
-                if i < len(errors_to_analyze):
-                    click.echo()  # Empty line between errors
+            errors_to_analyze = errors_to_analyze_by_file[file_path]
+            recommendations = ai_results.get(file_path, [None] * len(errors_to_analyze))
+            click.echo(_render_file(file_path, file_errors, errors_to_analyze, recommendations))
         
         click.echo(f"\n{'='*50}")
         click.echo("Analysis complete")
@@ -114,6 +127,162 @@ def check(path, no_ai, provider, max_errors):
         click.echo(f"Unexpected error: {e}")
 
 
+def _render_file(file_path: str, file_errors: List[ErrorEvent], errors_to_analyze: List[ErrorEvent],
+                 recommendations: list) -> str:
+    """
+    Render the check report for one file
+    
+    Args:
+        file_path: File the errors belong to
+        file_errors: All errors found in the file
+        errors_to_analyze: Errors to show, at most max_errors of them
+        recommendations: A Recommendation, exception or None for each error to show
+    
+    Returns:
+        The report text for the file
+    """
+    file_name = Path(file_path).name
+    # Collect the file's output so it is written with a single echo
+    output = [f"\n{file_name} ({len(file_errors)} errors)", "─" * 40]
+    
+    if len(file_errors) > len(errors_to_analyze):
+        output.append(f"Note: Showing first {len(errors_to_analyze)} of {len(file_errors)} errors")
+    
+    for i, (error, recommendation) in enumerate(zip(errors_to_analyze, recommendations), 1):
+        output.append(f"\nError {i}: {error.error_type} at line {error.line_number}")
+        output.append(f"Message: {error.message}")
+        
+        # Show just the highlighted error line for brevity
+        error_line = error.error_line
+        if error_line:
+            output.append(f"Code: {error_line}")
+        
+        # AI recommendation for this error
+        if isinstance(recommendation, BaseException):
+            output.append(f"AI analysis failed: {recommendation}")
+        elif recommendation is not None:
+            # Clean up explanation and fix text
+            explanation = recommendation.explanation.strip()
+            suggested_fix = recommendation.suggested_fix.strip()
+            
+            if recommendation.source == "rule":
+                output.append("Source: built-in rule (no AI request)")
+            output.append(f"Explanation: {explanation}")
+            output.append(f"Fix: {suggested_fix}")
+            
+            # Show confidence with color
+            confidence_template = _CONF_GREEN if recommendation.is_high_confidence() else _CONF_YELLOW
+            output.append(confidence_template % round(recommendation.confidence_score * 100))
+        
+        if i < len(errors_to_analyze):
+            output.append("")  # Empty line between errors
+    
+    return "\n".join(output)
+
+
+def _open_parse_cache(no_cache: bool, project_path: Path):
+    """Open the project's parse cache, or return None if disabled or unavailable"""
+    if no_cache:
+        return None
+    
+    import sqlite3
+    from pycodeadvisor.parse_cache import ParseCache
+    
+    try:
+        return ParseCache(project_path)
+    except (OSError, sqlite3.Error) as e:
+        click.echo(f"Parse cache unavailable: {e}")
+        return None
+
+
+def _open_response_cache(no_cache: bool, cache_ttl: float):
+    """Open the on-disk response cache, or return None if disabled or unavailable"""
+    if no_cache:
+        return None
+    
+    import sqlite3
+    from pycodeadvisor.response_cache import ResponseCache
+    
+    try:
+        return ResponseCache(ttl_days=cache_ttl)
+    except (OSError, sqlite3.Error) as e:
+        click.echo(f"Response cache unavailable: {e}")
+        return None
+
+
+def _analyze_unique_errors(ai_worker: 'AIWorker', errors_by_file: Dict[str, List[ErrorEvent]],
+                           batch: bool) -> Dict[str, list]:
+    """
+    Run AI analysis for each file's errors, analyzing identical errors only once
+    
+    Returns:
+        Per file, a Recommendation or the exception that stopped its analysis for each error
+    """
+    # Keep the first occurrence of each distinct (error_type, message, code) in its file's group
+    unique_by_file: Dict[str, List[ErrorEvent]] = {}
+    seen = set()
+    for file_path, errors in errors_by_file.items():
+        for error in errors:
+            key = _duplicate_key(error)
+            if key not in seen:
+                seen.add(key)
+                unique_by_file.setdefault(file_path, []).append(error)
+    
+    error_groups = list(unique_by_file.values())
+    if batch:
+        results = _analyze_in_batch_job(ai_worker, error_groups)
+    else:
+        import asyncio
+        results = asyncio.run(_analyze_all(ai_worker, error_groups))
+    
+    outcomes = {}
+    for errors, result in zip(error_groups, results):
+        for i, error in enumerate(errors):
+            outcomes[_duplicate_key(error)] = result if isinstance(result, BaseException) else result[i]
+    
+    # Fan the shared outcome back out to every occurrence, keeping its own location
+    ai_results = {}
+    for file_path, errors in errors_by_file.items():
+        file_results = ai_results[file_path] = []
+        for error in errors:
+            outcome = outcomes[_duplicate_key(error)]
+            if not isinstance(outcome, BaseException) and outcome.error_event is not error:
+                outcome = outcome.for_error_event(error)
+            file_results.append(outcome)
+    
+    return ai_results
+
+
+def _duplicate_key(error: ErrorEvent) -> tuple:
+    """Errors with the same key get the same AI analysis"""
+    return (error.error_type, error.message, tuple(error.code_context))
+
+
+async def _analyze_all(ai_worker: 'AIWorker', error_groups: List[List[ErrorEvent]]) -> list:
+    """Analyze each group of errors concurrently, returning recommendations or the exception per group"""
+    import asyncio
+    semaphore = asyncio.Semaphore(ai_worker.max_concurrency)
+    return await asyncio.gather(
+        *(ai_worker.analyze_errors_async(errors, semaphore) for errors in error_groups),
+        return_exceptions=True)
+
+
+def _analyze_in_batch_job(ai_worker: 'AIWorker', error_groups: List[List[ErrorEvent]]) -> list:
+    """Analyze all groups of errors in one provider batch job, returning recommendations or the exception per group"""
+    all_errors = [error for errors in error_groups for error in errors]
+    try:
+        recommendations = ai_worker.analyze_errors_in_batch_job(all_errors)
+    except Exception as e:
+        return [e] * len(error_groups)
+    
+    results = []
+    start = 0
+    for errors in error_groups:
+        results.append(recommendations[start:start + len(errors)])
+        start += len(errors)
+    return results
+
+
 @main.command()
 def config():
     """Show current configuration"""
@@ -164,14 +333,10 @@ def setup(env):
             click.echo("Configure API keys (press Enter to skip):")
             
             # Read current .env values
-            current_keys = {}
-            if env_file.exists():
-                with env_file.open('r') as f:
-                    for line in f:
-                        if '=' in line and not line.startswith('#'):
-                            key, value = line.strip().split('=', 1)
-                            if not value.startswith('your-'):
-                                current_keys[key] = value
+            env_lines = env_file.read_text().splitlines() if env_file.exists() else []
+            env_entries = (line.strip().split('=', 1) for line in env_lines
+                           if '=' in line and not line.startswith('#'))
+            current_keys = {key: value for key, value in env_entries if not value.startswith('your-')}
             
             # Update .env file with user input
             new_env_lines = ["# PyCodeAdvisor API Keys\n"]
@@ -195,8 +360,7 @@ def setup(env):
                     new_env_lines.append(f"{key}=your-key-here\n")
             
             # Write updated .env file
-            with env_file.open('w') as f:
-                f.writelines(new_env_lines)
+            env_file.write_text("".join(new_env_lines))
             
             click.echo(f"\n✓ .env file updated: {env_file}")
             click.echo("Your API keys are stored locally and will not be committed to git.")
@@ -246,16 +410,14 @@ def setup(env):
             if configured_providers:
                 if len(configured_providers) == 1:
                     default_provider = configured_providers[0]
-                    config_obj.config_data['default_provider'] = default_provider
-                    config_obj._save_config()
+                    config_obj.set_default_provider(default_provider)
                     click.echo(f"\nDefault provider set to: {default_provider}")
                 else:
                     click.echo(f"\nConfigured providers: {', '.join(configured_providers)}")
                     default = click.prompt("Choose default provider", 
                                          type=click.Choice(configured_providers),
                                          default=configured_providers[0])
-                    config_obj.config_data['default_provider'] = default
-                    config_obj._save_config()
+                    config_obj.set_default_provider(default)
                     click.echo(f"Default provider set to: {default}")
         
         click.echo(f"\n✓ Setup complete!")
@@ -276,7 +438,7 @@ def test_provider(provider):
         click.echo(f"Testing {provider} connection...")
         
         # Create a simple test error event
-        from pycodeadvisor.models import ErrorEvent
+        from pycodeadvisor.ai_worker import AIWorker
         test_error = ErrorEvent(
             file_path="test.py",
             line_number=1,
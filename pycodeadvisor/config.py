@@ -1,12 +1,137 @@
+import copy
+import functools
 import os
+import re
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+# Use the libyaml-backed loader and dumper when PyYAML was built with them
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Larger config files are parsed only up to the last top-level key before this size
+_MAX_CONFIG_BYTES = 64 * 1024
+# Top-level keys Config reads; a truncated parse is used only if it has all of them
+_REQUIRED_CONFIG_KEYS = ('providers', 'default_provider', 'analysis')
+_TOP_LEVEL_KEY_RE = re.compile(rb"^[^\s#\-][^\n]*:", re.MULTILINE)
+
+
+# Parsed config files keyed by (path, mtime_ns, size), least recently used first
+_PARSE_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[Dict[str, Any], bool]]" = OrderedDict()
+_PARSE_CACHE_SIZE = 8
+
+
+def _parse_yaml_file(path: str) -> Tuple[Dict[str, Any], bool]:
+    """
+    Parse a YAML file, reusing the result while its modification time and size are unchanged
+    
+    Returns:
+        The parsed data and whether it covers the whole file
+    """
+    stat = os.stat(path)
+    cache_key = (path, stat.st_mtime_ns, stat.st_size)
+    
+    cached = _PARSE_CACHE.get(cache_key)
+    if cached is not None:
+        _PARSE_CACHE.move_to_end(cache_key)
+        return cached
+    
+    result = _read_yaml_file(path)
+    _PARSE_CACHE[cache_key] = result
+    if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+    return result
+
+
+def _forget_parsed_file(path: str):
+    """Drop cached parses of a file that is being rewritten"""
+    for cache_key in [cache_key for cache_key in _PARSE_CACHE if cache_key[0] == path]:
+        del _PARSE_CACHE[cache_key]
+
+
+def _read_yaml_file(path: str) -> Tuple[Dict[str, Any], bool]:
+    """Read and parse a YAML file, returning the data and whether it covers the whole file"""
+    with open(path, 'rb') as f:
+        content = f.read(_MAX_CONFIG_BYTES + 1)
+        if len(content) > _MAX_CONFIG_BYTES:
+            data = _parse_config_head(content[:_MAX_CONFIG_BYTES])
+            if data is not None:
+                return data, False
+            content += f.read()
+    
+    return yaml.load(content, Loader=_Loader) or {}, True
+
+
+def _parse_config_head(head: bytes) -> Optional[Dict[str, Any]]:
+    """Parse the top-level keys that start before a truncation point, or None if a required key is missing"""
+    # The last key may be cut off, so parse only up to where it starts
+    key_starts = [match.start() for match in _TOP_LEVEL_KEY_RE.finditer(head)]
+    if len(key_starts) < 2:
+        return None
+    
+    try:
+        data = yaml.load(head[:key_starts[-1]], Loader=_Loader)
+    except yaml.YAMLError:
+        return None
+    
+    if not isinstance(data, dict) or not all(key in data for key in _REQUIRED_CONFIG_KEYS):
+        return None
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def _home_dir() -> str:
+    """The user's home directory, resolved once per process"""
+    return os.path.expanduser("~")
+
+
+@functools.lru_cache(maxsize=8)
+def _default_config_paths(cwd: str, home: str, appdata: Optional[str]) -> Tuple[Path, ...]:
+    """Build the default configuration file locations for a working directory and home"""
+    paths = []
+    
+    # 1. Current directory
+    paths.append(Path(cwd) / "pycodeadvisor.yaml")
+    
+    # 2. User home directory
+    home_path = Path(home) / ".pycodeadvisor" / "config.yaml"
+    paths.append(home_path)
+    
+    # 3. User config directory (cross-platform)
+    if os.name == 'posix':  # Unix-like systems (Linux, macOS)
+        config_dir = Path(home) / ".config" / "pycodeadvisor"
+    elif os.name == 'nt':  # Windows
+        config_dir = Path(appdata or home) / "pycodeadvisor"
+    else:  # Other systems
+        config_dir = Path(home) / ".pycodeadvisor"
+    
+    paths.append(config_dir / "config.yaml")
+    
+    return tuple(paths)
+
+
+# Environment variables that override config values, as (variable, provider type or None, key)
+_ENV_TARGETS = (
+    ('OPENAI_API_KEY', 'openai', 'api_key'),
+    ('ANTHROPIC_API_KEY', 'anthropic', 'api_key'),
+    ('GOOGLE_API_KEY', 'google', 'api_key'),
+    ('PYCODEADVISOR_PROVIDER', None, 'default_provider'),
+)
+_ENV_KEYS = frozenset(env_var for env_var, _, _ in _ENV_TARGETS)
+
+# Config file found per (custom path, working directory), shared by Config instances
+_DISCOVERED_CONFIG: Dict[Tuple[Optional[str], str], Path] = {}
 
 
 class Config:
     """Configuration management for PyCodeAdvisor"""
     
+    __slots__ = ('config_data', 'config_file', '_configured_providers', '_provider_configs',
+                 '_config_is_partial', '_dirty')
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize configuration manager
@@ -16,55 +141,29 @@ class Config:
         """
         self.config_data = {}
         self.config_file = None
+        self._configured_providers: Optional[List[str]] = None
+        # Ready-made get_provider_config results by provider type
+        self._provider_configs: Dict[str, Dict[str, Any]] = {}
+        # True when config_data holds only the head of a large config file
+        self._config_is_partial = False
+        # True when config_data has changes the config file does not have yet
+        self._dirty = False
         
         # Try to load configuration from various sources
         self._load_config(config_path)
     
     def _get_default_config_paths(self) -> List[Path]:
         """Get list of default configuration file locations in order of preference"""
-        paths = []
-        
-        # 1. Current directory
-        paths.append(Path.cwd() / "pycodeadvisor.yaml")
-        
-        # 2. User home directory
-        home_path = Path.home() / ".pycodeadvisor" / "config.yaml"
-        paths.append(home_path)
-        
-        # 3. User config directory (cross-platform)
-        if os.name == 'posix':  # Unix-like systems (Linux, macOS)
-            config_dir = Path.home() / ".config" / "pycodeadvisor"
-        elif os.name == 'nt':  # Windows
-            config_dir = Path(os.environ.get('APPDATA', str(Path.home()))) / "pycodeadvisor"
-        else:  # Other systems
-            config_dir = Path.home() / ".pycodeadvisor"
-        
-        paths.append(config_dir / "config.yaml")
-        
-        return paths
+        return list(_default_config_paths(os.getcwd(), _home_dir(), os.environ.get('APPDATA')))
     
     def _load_config(self, custom_path: Optional[str] = None):
         """Load configuration from file and environment variables"""
-        config_loaded = False
-        
-        if custom_path:
-            # Try custom path first
-            config_file = Path(custom_path)
-            if config_file.exists():
-                self.config_data = self._load_yaml_file(config_file)
-                self.config_file = config_file
-                config_loaded = True
-        
-        if not config_loaded:
-            # Try default locations
-            for config_path in self._get_default_config_paths():
-                if config_path.exists():
-                    self.config_data = self._load_yaml_file(config_path)
-                    self.config_file = config_path
-                    config_loaded = True
-                    break
-        
-        if not config_loaded:
+        config_file = self._find_config_file(custom_path)
+        
+        if config_file is not None:
+            self.config_data = self._load_yaml_file(config_file)
+            self.config_file = config_file
+        else:
             # Initialize with empty config
             self.config_data = self._get_default_config()
         
@@ -75,12 +174,33 @@ class Config:
         # Load from .env file if it exists
         # self.load_dotenv()
     
+    def _find_config_file(self, custom_path: Optional[str] = None) -> Optional[Path]:
+        """Find the configuration file to load, reusing the location found earlier in this process"""
+        cwd = os.getcwd()
+        cache_key = (custom_path, cwd)
+        config_file = _DISCOVERED_CONFIG.get(cache_key)
+        if config_file is not None and os.access(config_file, os.F_OK):
+            return config_file
+        
+        candidates = [Path(custom_path)] if custom_path else []
+        candidates.extend(_default_config_paths(cwd, _home_dir(), os.environ.get('APPDATA')))
+        
+        for candidate in candidates:
+            if os.access(candidate, os.F_OK):
+                # Misses are not remembered, so a config created later is still found
+                _DISCOVERED_CONFIG[cache_key] = candidate
+                return candidate
+        
+        _DISCOVERED_CONFIG.pop(cache_key, None)
+        return None
+    
     def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
         """Load YAML configuration file"""
         try:
-            with file_path.open('r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
-                return data
+            # Parsed data is shared between Config instances, so hand out a copy
+            data, complete = _parse_yaml_file(str(file_path))
+            self._config_is_partial = not complete
+            return copy.deepcopy(data)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration file {file_path}: {e}")
         except Exception as e:
@@ -112,18 +232,26 @@ class Config:
     
     def _load_environment_variables(self):
         """Override configuration with environment variables"""
-        # Provider API keys
-        env_mappings = {
-            'OPENAI_API_KEY': ['providers', 'openai', 'api_key'],
-            'ANTHROPIC_API_KEY': ['providers', 'anthropic', 'api_key'],
-            'GOOGLE_API_KEY': ['providers', 'google', 'api_key'],
-            'PYCODEADVISOR_PROVIDER': ['default_provider']
-        }
-        
-        for env_var, config_path in env_mappings.items():
-            env_value = os.environ.get(env_var)
-            if env_value:
-                self._set_nested_config(config_path, env_value)
+        # Usually none of the variables are set, so check them all with one set intersection
+        present = _ENV_KEYS & os.environ.keys()
+        if not present:
+            return
+        
+        for env_var, provider_type, key in _ENV_TARGETS:
+            if env_var not in present:
+                continue
+            env_value = os.environ[env_var]
+            if not env_value:
+                continue
+            
+            if provider_type is None:
+                target = self.config_data
+            else:
+                target = self.config_data.setdefault('providers', {}).setdefault(provider_type, {})
+            
+            if target.get(key) != env_value:
+                target[key] = env_value
+                self._dirty = True
     
     def load_dotenv(self):
         """Load variables from .env file"""
@@ -149,15 +277,6 @@ class Config:
         
         return env_path
     
-    def _set_nested_config(self, path: List[str], value: Any):
-        """Set nested configuration value"""
-        current = self.config_data
-        for key in path[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-        current[path[-1]] = value
-    
     def get_provider_config(self, provider_type: Optional[str] = None) -> Dict[str, Any]:
         """
         Get provider configuration for AIWorker
@@ -171,18 +290,23 @@ class Config:
         if provider_type is None:
             provider_type = self.config_data.get('default_provider', 'openai')
         
-        providers = self.config_data.get('providers', {})
-        provider_config = providers.get(provider_type, {})
+        cached = self._provider_configs.get(provider_type)
+        if cached is not None:
+            return dict(cached)
+        
+        provider_config = self.config_data.get('providers', {}).get(provider_type, {})
+        api_key = provider_config.get('api_key')
         
-        if not provider_config.get('api_key'):
+        if not api_key:
             raise ValueError(f"No API key configured for provider '{provider_type}'. "
                            f"Set it in config file or environment variable.")
         
-        return {
+        self._provider_configs[provider_type] = {
             'type': provider_type,
-            'api_key': provider_config['api_key'],
+            'api_key': api_key,
             'model': provider_config.get('model')
         }
+        return dict(self._provider_configs[provider_type])
     
     def get_analysis_config(self) -> Dict[str, Any]:
         """Get analysis configuration for SyntaxAnalyzer"""
@@ -202,30 +326,19 @@ class Config:
             True if configuration is valid
         """
         try:
-            provider_config = self.get_provider_config(provider_type)
-            
-            # Check required fields
-            if not provider_config.get('api_key'):
-                return False
-            
-            if not provider_config.get('type'):
-                return False
-            
-            return True
-            
+            # get_provider_config already requires an API key
+            return bool(self.get_provider_config(provider_type)['type'])
         except (ValueError, KeyError):
             return False
     
     def list_configured_providers(self) -> List[str]:
         """Get list of providers with API keys configured"""
-        configured = []
-        providers = self.config_data.get('providers', {})
-        
-        for provider_type, config in providers.items():
-            if config.get('api_key'):
-                configured.append(provider_type)
+        if self._configured_providers is None:
+            providers = self.config_data.get('providers', {})
+            self._configured_providers = [provider_type for provider_type, config in providers.items()
+                                          if config.get('api_key')]
         
-        return configured
+        return list(self._configured_providers)
     
     def create_config_file(self, config_path: Optional[Path] = None) -> Path:
         """
@@ -243,12 +356,15 @@ class Config:
         
         # Ensure directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
+        # A new file may take precedence over the one found before
+        _DISCOVERED_CONFIG.clear()
         
         # Create configuration file
         default_config = self._get_default_config()
         
+        _forget_parsed_file(str(config_path))
         with config_path.open('w', encoding='utf-8') as f:
-            yaml.dump(default_config, f, default_flow_style=False, indent=2)
+            yaml.dump(default_config, f, Dumper=_Dumper, default_flow_style=False, indent=2)
         
         return config_path
     
@@ -261,26 +377,58 @@ class Config:
             api_key: API key for the provider
             model: Optional model name
         """
-        if 'providers' not in self.config_data:
-            self.config_data['providers'] = {}
+        provider_config = self.config_data.setdefault('providers', {}).setdefault(provider_type, {})
         
-        if provider_type not in self.config_data['providers']:
-            self.config_data['providers'][provider_type] = {}
+        # Re-entering the current values is not a change
+        if provider_config.get('api_key') != api_key or (model and provider_config.get('model') != model):
+            provider_config['api_key'] = api_key
+            if model:
+                provider_config['model'] = model
+            
+            self._reset_provider_caches()
+            self._dirty = True
         
-        self.config_data['providers'][provider_type]['api_key'] = api_key
+        self._save_config()
+    
+    def set_default_provider(self, provider_type: str):
+        """
+        Set the default provider and save to file
         
-        if model:
-            self.config_data['providers'][provider_type]['model'] = model
+        Args:
+            provider_type: Provider type (openai, anthropic, google)
+        """
+        if self.config_data.get('default_provider') != provider_type:
+            self.config_data['default_provider'] = provider_type
+            self._dirty = True
         
         self._save_config()
     
+    def _reset_provider_caches(self):
+        """Forget provider lookups derived from config_data after it changes"""
+        self._configured_providers = None
+        self._provider_configs.clear()
+    
     def _save_config(self):
-        """Save current configuration to file"""
+        """Save current configuration to file, unless the file is already up to date"""
+        if not self._dirty and self.config_file is not None:
+            return
+        
+        self._reset_provider_caches()
         if self.config_file is None:
             self.config_file = self.create_config_file()
         
+        config_data = self.config_data
+        if self._config_is_partial:
+            # Keys past the parsed head of a large file were never loaded, so keep them from the file
+            with self.config_file.open('r', encoding='utf-8') as f:
+                config_data = yaml.load(f, Loader=_Loader) or {}
+            config_data.update(self.config_data)
+        
+        _forget_parsed_file(str(self.config_file))
         with self.config_file.open('w', encoding='utf-8') as f:
-            yaml.dump(self.config_data, f, default_flow_style=False, indent=2)
+            yaml.dump(config_data, f, Dumper=_Dumper, default_flow_style=False, indent=2)
+        
+        self._dirty = False
     
     def get_config_file_path(self) -> Optional[Path]:
         """Get path to current configuration file"""
@@ -0,0 +1,22 @@
+import json
+from typing import Any, Union
+
+# orjson is optional (pip install pycodeadvisor[fast]); the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str; raises ValueError on invalid input"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,16 +1,22 @@
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 import json
+from pycodeadvisor import json_compat
 
 class ErrorEvent:
     """Represents a detected error in Python code"""
     
+    # Slots instead of a per-instance __dict__, since large projects create many events
+    __slots__ = ('_file_path', '_path', 'line_number', 'error_type', 'message', 'code_context',
+                 'context_start_line', 'stack_trace', 'local_variables', 'timestamp')
+    
     def __init__(self, file_path: str, line_number: int, error_type: str, message: str,
                  code_context: Optional[List[str]] = None, 
                  context_start_line: Optional[int] = None,
                  stack_trace: Optional[str] = None, 
-                 local_variables: Optional[Dict] = None):
+                 local_variables: Optional[Dict] = None,
+                 timestamp: Optional[datetime] = None):
         """
         Initialize an ErrorEvent
         
@@ -23,8 +29,11 @@ class ErrorEvent:
             context_start_line: What line number does code_context[0] represent
             stack_trace: Full stack trace (None for static analysis)
             local_variables: Local variables at error point (None for static analysis)
+            timestamp: When the error was detected. If None, uses the current time; pass one
+                shared value when creating many events at once.
         """
-        self.file_path = Path(file_path)
+        self._file_path = str(file_path)
+        self._path: Optional[Path] = None
         self.line_number = line_number
         self.error_type = error_type
         self.message = message
@@ -32,12 +41,29 @@ class ErrorEvent:
         self.context_start_line = context_start_line
         self.stack_trace = stack_trace
         self.local_variables = local_variables or {}
-        self.timestamp = datetime.now()
+        self.timestamp = timestamp or datetime.now()
+    
+    @property
+    def file_path(self) -> Path:
+        """Path to the file where the error occurred, created on first access"""
+        if self._path is None:
+            self._path = Path(self._file_path)
+        return self._path
+    
+    @file_path.setter
+    def file_path(self, value):
+        self._file_path = str(value)
+        self._path = None
+    
+    @property
+    def file_path_str(self) -> str:
+        """File path as the string the event was created with"""
+        return self._file_path
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert ErrorEvent to dictionary for serialization"""
         return {
-            'file_path': str(self.file_path),
+            'file_path': self._file_path,
             'line_number': self.line_number,
             'error_type': self.error_type,
             'message': self.message,
@@ -81,6 +107,15 @@ class ErrorEvent:
         
         return cls_object
     
+    def to_json(self) -> bytes:
+        """Serialize ErrorEvent to UTF-8 JSON"""
+        return json_compat.dumps(self.to_dict())
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> 'ErrorEvent':
+        """Create ErrorEvent from JSON produced by to_json"""
+        return cls.from_dict(json_compat.loads(data))
+    
     def get_context_snippet(self, lines_before: int = 3, lines_after: int = 3) -> str:
         """Get formatted code context around the error"""
         # Check if we have context
@@ -98,19 +133,27 @@ class ErrorEvent:
         start_index = max(0, error_index - lines_before)
         end_index = min(len(self.code_context), error_index + lines_after + 1)
         
-        # Format lines with line numbers
-        formatted_lines = []
-        for i in range(start_index, end_index):
-            actual_line_number = self.context_start_line + i
-            code_line = self.code_context[i]
-            
-            # Highlight the error line
-            if i == error_index:
-                formatted_lines.append(f">>> {actual_line_number:3}: {code_line}")
-            else:
-                formatted_lines.append(f"    {actual_line_number:3}: {code_line}")
+        # Format lines with line numbers, highlighting the error line
+        code_context = self.code_context
+        context_start_line = self.context_start_line
+        line_format = "    {:3}: {}".format
+        error_line_format = ">>> {:3}: {}".format
         
-        return "\n".join(formatted_lines)
+        return "\n".join(
+            (error_line_format if i == error_index else line_format)(context_start_line + i, code_context[i])
+            for i in range(start_index, end_index))
+    
+    @property
+    def error_line(self) -> str:
+        """The highlighted error line as shown by get_context_snippet, or "" if not in context"""
+        if not self.code_context or self.context_start_line is None:
+            return ""
+        
+        error_index = self.line_number - self.context_start_line
+        if error_index < 0 or error_index >= len(self.code_context):
+            return ""
+        
+        return f">>> {self.line_number:3}: {self.code_context[error_index]}"
     
     def is_runtime_error(self) -> bool:
         """Check if this is a runtime error (has stack trace) vs static analysis"""
@@ -121,14 +164,17 @@ class ErrorEvent:
     
     def __str__(self) -> str:
         """String representation for debugging"""
-        return f"{self.file_path}:{self.line_number}: {self.error_type} - {self.message}"
+        return f"{self._file_path}:{self.line_number}: {self.error_type} - {self.message}"
 
 
 class Recommendation:
     """Represents an AI-generated recommendation for fixing an error"""
     
+    __slots__ = ('error_event', 'explanation', 'suggested_fix', 'confidence_score',
+                 'references', 'source', 'created_at')
+    
     def __init__(self, error_event: ErrorEvent, explanation: str, suggested_fix: str,
-                 confidence_score: float, references: List[str]):
+                 confidence_score: float, references: List[str], source: str = "ai"):
         """
         Initialize a Recommendation
         
@@ -138,12 +184,14 @@ class Recommendation:
             suggested_fix: Specific steps to fix the error
             confidence_score: AI confidence in the recommendation (0.0 - 1.0)
             references: List of documentation links or resources
+            source: "ai" for provider answers, "rule" for built-in canned answers
         """
         self.error_event = error_event
         self.explanation = explanation
         self.suggested_fix = suggested_fix
         self.confidence_score = confidence_score
         self.references = references
+        self.source = source
         self.created_at = datetime.now()
     
     def to_dict(self) -> Dict[str, Any]:
@@ -157,10 +205,15 @@ class Recommendation:
         result['suggested_fix'] = self.suggested_fix
         result['confidence_score'] = self.confidence_score
         result['references'] = self.references
+        result['source'] = self.source
         result['created_at'] = self.created_at.isoformat()
 
         return result
     
+    def to_json(self) -> bytes:
+        """Serialize Recommendation to UTF-8 JSON"""
+        return json_compat.dumps(self.to_dict())
+    
     def format_for_terminal(self) -> str:
         """Format recommendation for terminal output with colors"""
         return f"""
@@ -175,6 +228,11 @@ class Recommendation:
         Confidence: {self.confidence_score:.1%}
         """
     
+    def for_error_event(self, error_event: ErrorEvent) -> 'Recommendation':
+        """Copy this recommendation for another occurrence of the same error"""
+        return Recommendation(error_event, self.explanation, self.suggested_fix,
+                              self.confidence_score, list(self.references), self.source)
+    
     def is_high_confidence(self) -> bool:
         """Check if recommendation has high confidence (>0.7)"""
         # TODO: Implement this method
@@ -188,6 +246,8 @@ class Recommendation:
 class RecommendationBuilder:
     """Builder pattern for constructing Recommendation objects step by step"""
     
+    __slots__ = ('_error_event', '_explanation', '_suggested_fix', '_confidence_score', '_references', '_source')
+    
     def __init__(self):
         """Initialize empty builder"""
         self._error_event: Optional[ErrorEvent] = None
@@ -195,6 +255,7 @@ class RecommendationBuilder:
         self._suggested_fix: Optional[str] = None
         self._confidence_score: Optional[float] = None
         self._references: List[str] = []
+        self._source = "ai"
     
     def set_error_event(self, error_event: ErrorEvent) -> 'RecommendationBuilder':
         """Set the error event this recommendation addresses"""
@@ -220,6 +281,11 @@ class RecommendationBuilder:
         self._confidence_score = max(0.0, min(1.0, score))  # Clamp between 0 and 1
         return self
     
+    def set_source(self, source: str) -> 'RecommendationBuilder':
+        """Set where the answer came from ('ai' or 'rule')"""
+        self._source = source
+        return self
+    
     def add_reference(self, reference: str) -> 'RecommendationBuilder':
         """Add a documentation reference or helpful link"""
         # TODO: Implement this method
@@ -231,16 +297,18 @@ class RecommendationBuilder:
         """Build the final Recommendation object"""
         # TODO: Implement this method with validation
         # Hint: Check required fields are set, raise ValueError if not, create Recommendation
-        if self._error_event is None:
-            raise ValueError("ErrorEvent is required - call set_error_event() first")
-        if self._explanation is None:
-            raise ValueError("Explanation is required - call set_explanation() first")
-        if self._suggested_fix is None:
-            raise ValueError("Suggested Fix is required - call set_suggested_fix() first")
-        if self._confidence_score is None:
-            raise ValueError("Confidence Score is required - call set_confidence_score() first")
+        # One check on the common path; work out which field is missing only on failure
+        if None in (self._error_event, self._explanation, self._suggested_fix, self._confidence_score):
+            missing = [f"{name} is required - call {setter}() first"
+                       for name, setter, value in (
+                           ("ErrorEvent", "set_error_event", self._error_event),
+                           ("Explanation", "set_explanation", self._explanation),
+                           ("Suggested Fix", "set_suggested_fix", self._suggested_fix),
+                           ("Confidence Score", "set_confidence_score", self._confidence_score))
+                       if value is None]
+            raise ValueError("; ".join(missing))
         
-        recommendation = Recommendation(self._error_event, self._explanation, self._suggested_fix, self._confidence_score, self._references)
+        recommendation = Recommendation(self._error_event, self._explanation, self._suggested_fix, self._confidence_score, self._references, self._source)
         return recommendation
     
     def reset(self) -> 'RecommendationBuilder':
@@ -250,4 +318,5 @@ class RecommendationBuilder:
         self._suggested_fix = None
         self._confidence_score = None
         self._references = []
+        self._source = "ai"
         return self
\ No newline at end of file
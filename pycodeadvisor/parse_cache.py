@@ -0,0 +1,120 @@
+import hashlib
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from pycodeadvisor import json_compat
+from pycodeadvisor.models import ErrorEvent
+from pycodeadvisor.response_cache import get_default_cache_dir
+
+# Bump when syntax analysis can produce different errors for the same file;
+# cached results are also dropped when the Python version (and so ast.parse) changes
+_CACHE_FORMAT = 2
+_CACHE_VERSION = _CACHE_FORMAT * 10000 + sys.version_info[0] * 100 + sys.version_info[1]
+
+
+class ParseCache:
+    """Per-project SQLite store of syntax analysis results, so unchanged files are not re-parsed"""
+    
+    def __init__(self, project_path: Path, db_path: Optional[Path] = None):
+        """
+        Open (or create) the parse cache of a project
+        
+        Args:
+            project_path: Project directory whose files are cached
+            db_path: SQLite file to use. If None, uses a file named after the project path
+                in the user cache directory, so the project itself is never written to.
+        """
+        if db_path is None:
+            project_key = hashlib.blake2b(os.fsencode(str(Path(project_path).resolve())), digest_size=8).hexdigest()
+            db_path = get_default_cache_dir() / "parse" / f"{project_key}.sqlite"
+        
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._entries: Optional[Dict[str, Tuple[int, int, bytes, bytes]]] = None
+        self._fingerprints: Dict[str, Tuple[int, int, bytes]] = {}
+        self._pending: List[Tuple[str, int, int, bytes, bytes]] = []
+        
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, hash BLOB, errors BLOB)")
+            
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != _CACHE_VERSION:
+                self._conn.execute("DELETE FROM parse_cache")
+                self._conn.execute(f"PRAGMA user_version = {_CACHE_VERSION}")
+    
+    def get(self, file_path: Union[str, Path]) -> Tuple[Optional[List[ErrorEvent]], Optional[bytes]]:
+        """
+        Look up the cached errors of a file, matching it by modification time and
+        size first, then by a blake2b hash of its content
+        
+        On a miss the file's fingerprint is kept for put().
+        
+        Returns:
+            (cached errors, None) on a hit; (None, content read for hashing) on a miss,
+            so the caller can analyze it without reading the file again. The content is
+            None when the file could not be read.
+        """
+        if self._entries is None:
+            self._entries = {
+                row[0]: row[1:]
+                for row in self._conn.execute("SELECT path, mtime_ns, size, hash, errors FROM parse_cache")
+            }
+        
+        key = os.fspath(file_path)
+        try:
+            stat = os.stat(key)
+            entry = self._entries.get(key)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                return self._decode_errors(entry[3]), None
+            
+            with open(key, 'rb') as f:
+                data = f.read()
+        except OSError:
+            # Unreadable files are analyzed (and reported) without caching
+            return None, None
+        
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if entry and entry[2] == digest:
+            # Touched but unchanged; refresh the stored modification time
+            self._pending.append((key, stat.st_mtime_ns, stat.st_size, digest, entry[3]))
+            return self._decode_errors(entry[3]), None
+        
+        self._fingerprints[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        return None, data
+    
+    def put(self, file_path: Union[str, Path], errors: List[ErrorEvent]):
+        """Record the analysis result of a file previously missed by get()"""
+        fingerprint = self._fingerprints.pop(str(file_path), None)
+        if fingerprint is not None:
+            payload = json_compat.dumps([error.to_dict() for error in errors])
+            self._pending.append((str(file_path), *fingerprint, payload))
+    
+    def flush(self, current_paths: Iterable[Union[str, Path]]):
+        """Write recorded results and forget files that are no longer part of the project"""
+        stale = set(self._entries or ()).difference(map(os.fspath, current_paths))
+        
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO parse_cache (path, mtime_ns, size, hash, errors) VALUES (?, ?, ?, ?, ?)",
+                    self._pending)
+                self._conn.executemany("DELETE FROM parse_cache WHERE path = ?", ((path,) for path in stale))
+        except sqlite3.Error:
+            # The cache is best-effort; results are simply recomputed next run
+            pass
+        
+        self._pending = []
+        self._entries = None
+    
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
+    
+    def _decode_errors(self, payload: bytes) -> List[ErrorEvent]:
+        """Rebuild the error events stored for a file"""
+        return [ErrorEvent.from_dict(data) for data in json_compat.loads(payload)]
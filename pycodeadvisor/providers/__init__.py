@@ -1,11 +1,41 @@
+from typing import Dict, Optional, Type
 from pycodeadvisor.providers.base_provider_interface import BaseProvider
 from pycodeadvisor.providers.openAI_provider import OpenAIProvider
 from pycodeadvisor.providers.claude_provider import AnthropicProvider
 from pycodeadvisor.providers.gemini_provider import GoogleProvider
 
+# Provider type names accepted in configuration, mapped to their implementation
+PROVIDER_REGISTRY: Dict[str, Type[BaseProvider]] = {
+    'openai': OpenAIProvider,
+    'anthropic': AnthropicProvider,
+    'google': GoogleProvider,
+}
+
+
+def create_provider(provider_type: str, api_key: str, model: Optional[str] = None) -> BaseProvider:
+    """
+    Create a provider by type name
+    
+    Args:
+        provider_type: Key in PROVIDER_REGISTRY
+        api_key: API key for the provider
+        model: Model name. If None, uses the provider's default model.
+        
+    Returns:
+        Provider instance
+    """
+    provider_class = PROVIDER_REGISTRY.get(provider_type)
+    if provider_class is None:
+        raise ValueError(f"Unsupported provider: {provider_type}. Supported: {', '.join(PROVIDER_REGISTRY)}")
+    
+    return provider_class(api_key, model) if model else provider_class(api_key)
+
+
 __all__ = [
     'BaseProvider',
     'OpenAIProvider', 
     'AnthropicProvider',
-    'GoogleProvider'
-]
\ No newline at end of file
+    'GoogleProvider',
+    'PROVIDER_REGISTRY',
+    'create_provider'
+]
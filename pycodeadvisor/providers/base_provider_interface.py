@@ -1,17 +1,33 @@
+import asyncio
+import requests
 from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
 
 
 class BaseProvider(ABC):
     """Abstract base class for AI providers"""
     
+    # Whether submit_batch/get_batch_results are implemented
+    supports_batch = False
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
     
     @abstractmethod
-    def generate_recommendation(self, prompt: str) -> str:
-        """Generate AI response from prompt"""
+    def generate_recommendation(self, system: str, prompt: str) -> str:
+        """Generate AI response from a static system prompt and a per-request user prompt"""
         pass
     
+    async def agenerate_recommendation(self, system: str, prompt: str) -> str:
+        """Async version of generate_recommendation
+        
+        Runs the blocking request on the event loop's default thread pool; providers
+        with a native async client can override this.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.generate_recommendation, system, prompt)
+    
     @abstractmethod
     def get_max_tokens(self) -> int:
         """Return maximum tokens for this provider"""
@@ -20,4 +36,30 @@ class BaseProvider(ABC):
     @abstractmethod
     def get_model_name(self) -> str:
         """Return model name/identifier"""
-        pass
\ No newline at end of file
+        pass
+    
+    def _create_session(self, headers: Dict[str, str]) -> requests.Session:
+        """
+        Create the HTTP session shared by all of this provider's requests
+        
+        Providers create it once in __init__ and reuse it for every call, so
+        connections are kept alive between requests.
+        
+        Args:
+            headers: Headers sent with every request, such as authentication
+            
+        Returns:
+            Session with a keep-alive connection pool mounted for HTTPS
+        """
+        session = requests.Session()
+        session.headers.update(headers)
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        return session
+    
+    def submit_batch(self, system: str, prompts: Dict[str, str]) -> str:
+        """Submit user prompts keyed by custom id, sharing one system prompt, as an asynchronous batch job"""
+        raise NotImplementedError(f"{type(self).__name__} does not support batch jobs")
+    
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Return responses keyed by custom id once the batch has finished, or None while it is running"""
+        raise NotImplementedError(f"{type(self).__name__} does not support batch jobs")
\ No newline at end of file
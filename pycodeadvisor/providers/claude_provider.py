@@ -1,41 +1,102 @@
 import requests
+from typing import Any, Dict, Optional
+from pycodeadvisor import json_compat
 from pycodeadvisor.providers.base_provider_interface import BaseProvider
 
 
 class AnthropicProvider(BaseProvider):
     """Anthropic Claude provider implementation"""
     
+    supports_batch = True
+    
     def __init__(self, api_key: str, model: str = "claude-3-haiku-20240307"):
         super().__init__(api_key)
         self.model = model
         self.base_url = "https://api.anthropic.com/v1/messages"
-    
-    def generate_recommendation(self, prompt: str) -> str:
-        headers = {
-            "x-api-key": self.api_key,
-            "Content-Type": "application/json",
+        self.batch_url = "https://api.anthropic.com/v1/messages/batches"
+        self._session = self._create_session({
+            "x-api-key": api_key,
             "anthropic-version": "2023-06-01"
+        })
+        self._base_data = {
+            "model": model,
+            "max_tokens": 500
         }
+    
+    def generate_recommendation(self, system: str, prompt: str) -> str:
+        data = self._build_request_data(system, prompt)
         
-        data = {
-            "model": self.model,
-            "max_tokens": 500,
+        try:
+            response = self._session.post(self.base_url, json=data, timeout=30)
+            response.raise_for_status()
+            
+            response_data = json_compat.loads(response.content)
+            return self._extract_text(response_data)
+        
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+        except (KeyError, IndexError, ValueError) as e:
+            raise Exception(f"Invalid Anthropic response format: {str(e)}")
+    
+    def _build_request_data(self, system: str, prompt: str) -> Dict[str, Any]:
+        """Build the messages request body for a prompt"""
+        return {
+            **self._base_data,
             "messages": [
                 {"role": "user", "content": prompt}
             ],
-            "system": "You are a Python code analysis expert. Provide clear, actionable advice for fixing code errors."
+            "system": system
+        }
+    
+    def _extract_text(self, response_data: Dict[str, Any]) -> str:
+        """Extract the answer text from a messages response body"""
+        return response_data['content'][0]['text'].strip()
+    
+    def submit_batch(self, system: str, prompts: Dict[str, str]) -> str:
+        """Start a Message Batches job with one request per prompt"""
+        data = {
+            "requests": [
+                {"custom_id": custom_id, "params": self._build_request_data(system, prompt)}
+                for custom_id, prompt in prompts.items()
+            ]
         }
         
         try:
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
+            response = self._session.post(self.batch_url, json=data, timeout=60)
             response.raise_for_status()
+            return json_compat.loads(response.content)['id']
+        
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+        except (KeyError, ValueError) as e:
+            raise Exception(f"Invalid Anthropic response format: {str(e)}")
+    
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Check a Message Batches job and download its results once processing has ended"""
+        try:
+            response = self._session.get(f"{self.batch_url}/{batch_id}", timeout=30)
+            response.raise_for_status()
+            batch = json_compat.loads(response.content)
             
-            response_data = response.json()
-            return response_data['content'][0]['text'].strip()
+            if batch['processing_status'] != "ended":
+                return None
             
+            output = self._session.get(batch['results_url'], timeout=60)
+            output.raise_for_status()
+            
+            results = {}
+            for line in output.content.splitlines():
+                if not line.strip():
+                    continue
+                result = json_compat.loads(line)
+                if result['result']['type'] == "succeeded":
+                    results[result['custom_id']] = self._extract_text(result['result']['message'])
+            
+            return results
+        
         except requests.exceptions.RequestException as e:
             raise Exception(f"Anthropic API error: {str(e)}")
-        except (KeyError, IndexError) as e:
+        except (KeyError, IndexError, ValueError) as e:
             raise Exception(f"Invalid Anthropic response format: {str(e)}")
     
     def get_max_tokens(self) -> int:
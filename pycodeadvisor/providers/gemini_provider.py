@@ -1,4 +1,6 @@
 import requests
+from typing import Any, Dict
+from pycodeadvisor import json_compat
 from pycodeadvisor.providers.base_provider_interface import BaseProvider
 
 
@@ -9,42 +11,41 @@ class GoogleProvider(BaseProvider):
         super().__init__(api_key)
         self.model = model
         self.base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
-    
-    def generate_recommendation(self, prompt: str) -> str:
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        # Add system instruction to the prompt for Google
-        enhanced_prompt = f"""You are a Python code analysis expert. Provide clear, actionable advice for fixing code errors.
-
-{prompt}"""
-        
-        data = {
-            "contents": [{
-                "parts": [{"text": enhanced_prompt}]
-            }],
+        # The key is sent as a header so it never appears in request URLs or error messages.
+        self._session = self._create_session({"x-goog-api-key": api_key})
+        self._base_data = {
             "generationConfig": {
                 "temperature": 0.1,
                 "maxOutputTokens": 500
             }
         }
+        # systemInstruction payloads by system prompt; AIWorker only sends a few distinct ones
+        self._system_instructions: Dict[str, Dict[str, Any]] = {}
+    
+    def generate_recommendation(self, system: str, prompt: str) -> str:
+        # Static instructions go in systemInstruction, separate from the per-error prompt
+        system_instruction = self._system_instructions.get(system)
+        if system_instruction is None:
+            system_instruction = self._system_instructions[system] = {"parts": [{"text": system}]}
+        
+        data = {
+            **self._base_data,
+            "systemInstruction": system_instruction,
+            "contents": [{
+                "parts": [{"text": prompt}]
+            }]
+        }
         
         try:
-            response = requests.post(
-                f"{self.base_url}?key={self.api_key}", 
-                headers=headers, 
-                json=data, 
-                timeout=30
-            )
+            response = self._session.post(self.base_url, json=data, timeout=30)
             response.raise_for_status()
             
-            response_data = response.json()
+            response_data = json_compat.loads(response.content)
             return response_data['candidates'][0]['content']['parts'][0]['text'].strip()
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"Google API error: {str(e)}")
-        except (KeyError, IndexError) as e:
+        except (KeyError, IndexError, ValueError) as e:
             raise Exception(f"Invalid Google response format: {str(e)}")
     
     def get_max_tokens(self) -> int:
@@ -1,44 +1,127 @@
 import requests
+from typing import Any, Dict, Optional
+from pycodeadvisor import json_compat
 from pycodeadvisor.providers.base_provider_interface import BaseProvider
 
 
 class OpenAIProvider(BaseProvider):
     """OpenAI GPT provider implementation"""
     
+    supports_batch = True
+    
     def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
         super().__init__(api_key)
         self.model = model
         self.base_url = "https://api.openai.com/v1/chat/completions"
-    
-    def generate_recommendation(self, prompt: str) -> str:
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+        self.api_root = "https://api.openai.com/v1"
+        self._session = self._create_session({"Authorization": f"Bearer {api_key}"})
+        self._base_data = {
+            "model": model,
+            "max_tokens": 500,
+            "temperature": 0.1
         }
+    
+    def generate_recommendation(self, system: str, prompt: str) -> str:
+        data = self._build_request_data(system, prompt)
         
-        data = {
-            "model": self.model,
+        try:
+            response = self._session.post(self.base_url, json=data, timeout=30)
+            response.raise_for_status()
+            
+            response_data = json_compat.loads(response.content)
+            return self._extract_text(response_data)
+        
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+        except (KeyError, IndexError, ValueError) as e:
+            raise Exception(f"Invalid OpenAI response format: {str(e)}")
+    
+    def _build_request_data(self, system: str, prompt: str) -> Dict[str, Any]:
+        """Build the chat completions request body for a prompt"""
+        # The system message comes first so OpenAI's automatic prompt caching can reuse it
+        return {
+            **self._base_data,
             "messages": [
-                {
-                    "role": "system", 
-                    "content": "You are a Python code analysis expert. Provide clear, actionable advice for fixing code errors."
-                },
+                {"role": "system", "content": system},
                 {"role": "user", "content": prompt}
-            ],
-            "max_tokens": 500,
-            "temperature": 0.1
+            ]
         }
+    
+    def _extract_text(self, response_data: Dict[str, Any]) -> str:
+        """Extract the answer text from a chat completions response body"""
+        return response_data['choices'][0]['message']['content'].strip()
+    
+    def submit_batch(self, system: str, prompts: Dict[str, str]) -> str:
+        """Upload prompts as a JSONL file and start a Batch API job over it"""
+        batch_lines = [
+            json_compat.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_request_data(system, prompt)
+            })
+            for custom_id, prompt in prompts.items()
+        ]
         
         try:
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
+            upload = self._session.post(
+                f"{self.api_root}/files",
+                data={"purpose": "batch"},
+                files={"file": ("pycodeadvisor_batch.jsonl", b"\n".join(batch_lines))},
+                timeout=60
+            )
+            upload.raise_for_status()
+            
+            batch = self._session.post(
+                f"{self.api_root}/batches",
+                json={
+                    "input_file_id": json_compat.loads(upload.content)['id'],
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h"
+                },
+                timeout=30
+            )
+            batch.raise_for_status()
+            return json_compat.loads(batch.content)['id']
+        
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+        except (KeyError, ValueError) as e:
+            raise Exception(f"Invalid OpenAI response format: {str(e)}")
+    
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Check a Batch API job and download its output once completed"""
+        try:
+            response = self._session.get(f"{self.api_root}/batches/{batch_id}", timeout=30)
             response.raise_for_status()
+            batch = json_compat.loads(response.content)
+            
+            status = batch['status']
+            if status in ("failed", "expired", "cancelled"):
+                raise Exception(f"OpenAI batch {batch_id} {status}")
+            if status != "completed":
+                return None
             
-            response_data = response.json()
-            return response_data['choices'][0]['message']['content'].strip()
+            results = {}
+            if not batch.get('output_file_id'):
+                return results
             
+            output = self._session.get(f"{self.api_root}/files/{batch['output_file_id']}/content", timeout=60)
+            output.raise_for_status()
+            
+            for line in output.content.splitlines():
+                if not line.strip():
+                    continue
+                result = json_compat.loads(line)
+                response_info = result.get('response') or {}
+                if response_info.get('status_code') == 200:
+                    results[result['custom_id']] = self._extract_text(response_info['body'])
+            
+            return results
+        
         except requests.exceptions.RequestException as e:
             raise Exception(f"OpenAI API error: {str(e)}")
-        except (KeyError, IndexError) as e:
+        except (KeyError, IndexError, ValueError) as e:
             raise Exception(f"Invalid OpenAI response format: {str(e)}")
     
     def get_max_tokens(self) -> int:
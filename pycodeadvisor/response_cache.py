@@ -0,0 +1,72 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from pycodeadvisor import json_compat
+
+
+def get_default_cache_dir() -> Path:
+    """Get the per-user cache directory for PyCodeAdvisor"""
+    if os.name == 'nt':  # Windows
+        base = Path(os.environ.get('LOCALAPPDATA', str(Path.home())))
+    else:
+        base = Path(os.environ.get('XDG_CACHE_HOME', str(Path.home() / ".cache")))
+    
+    return base / "pycodeadvisor"
+
+
+class ResponseCache:
+    """Persistent SQLite store of parsed AI responses, shared between CLI runs"""
+    
+    def __init__(self, db_path: Optional[Path] = None, ttl_days: Optional[float] = 30):
+        """
+        Open (or create) the response cache and prune expired entries
+        
+        Args:
+            db_path: SQLite file to use. If None, uses responses.sqlite in the user cache directory.
+            ttl_days: Entries older than this many days are deleted on open. None keeps entries forever.
+        """
+        self.db_path = Path(db_path) if db_path else get_default_cache_dir() / "responses.sqlite"
+        self.ttl_days = ttl_days
+        self._lock = threading.Lock()
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS resp ("
+                "hash TEXT PRIMARY KEY, provider TEXT, model TEXT, payload BLOB, created_at INTEGER)")
+            
+            if ttl_days is not None:
+                cutoff = int(time.time() - ttl_days * 86400)
+                self._conn.execute("DELETE FROM resp WHERE created_at < ?", (cutoff,))
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parsed response for a key, or None on miss"""
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT payload FROM resp WHERE hash = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        
+        return json_compat.loads(row[0]) if row else None
+    
+    def put(self, key: str, provider: str, model: str, parsed_response: Dict[str, Any]):
+        """Store a parsed response; failures are ignored since the cache is best-effort"""
+        payload = json_compat.dumps(parsed_response)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO resp (hash, provider, model, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, provider, model, payload, int(time.time())))
+        except sqlite3.Error:
+            pass
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
@@ -0,0 +1,126 @@
+import re
+from typing import Any, Dict, List, Optional
+
+from pycodeadvisor.models import ErrorEvent
+
+
+# Location details that vary between otherwise identical errors
+_LOCATION_RE = re.compile(r"\([^()]*, line \d+\)|line \d+")
+
+
+class SemanticCache:
+    """Reuses parsed AI responses for errors that describe the same problem
+
+    Errors are embedded locally with sentence-transformers and compared by cosine
+    similarity, so the cache still hits when only file paths or line numbers differ.
+    Requires the optional 'semantic' extra (sentence-transformers, numpy); without
+    it every lookup falls through to the provider.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 1024,
+                 model_name: str = "all-MiniLM-L6-v2"):
+        """
+        Initialize an empty SemanticCache
+
+        Args:
+            threshold: Minimum cosine similarity for reusing a cached response
+            max_entries: Maximum cached responses before least recently used are evicted
+            model_name: sentence-transformers model used for embeddings
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._available: Optional[bool] = None
+        self._model = None
+        self._last_query = None  # (text, embedding) of the most recent lookup
+        self._embeddings = None  # preallocated float32 matrix, one normalized row per entry
+        self._responses: List[Dict[str, Any]] = []
+        self._last_used: List[int] = []
+        self._clock = 0
+
+    def is_available(self) -> bool:
+        """Check if the optional embedding dependencies are installed"""
+        if self._available is None:
+            try:
+                import numpy  # noqa: F401
+                import sentence_transformers  # noqa: F401
+                self._available = True
+            except ImportError:
+                self._available = False
+        return self._available
+
+    def lookup(self, error_event: ErrorEvent) -> Optional[Dict[str, Any]]:
+        """Return the cached response for the most similar error, if similar enough"""
+        if not self.is_available():
+            return None
+
+        index = self._find_similar(self._embed(self._canonicalize(error_event)))
+        if index is None:
+            return None
+
+        self._touch(index)
+        return self._responses[index]
+
+    def store(self, error_event: ErrorEvent, response: Dict[str, Any]):
+        """Cache a parsed response for an error"""
+        if not self.is_available():
+            return
+
+        self._add(self._embed(self._canonicalize(error_event)), response)
+
+    def _canonicalize(self, error_event: ErrorEvent) -> str:
+        """Reduce an error to the text that identifies the underlying problem"""
+        message = _LOCATION_RE.sub("", error_event.message).strip()
+        return f"{error_event.error_type}:{message}"
+
+    def _embed(self, text: str):
+        """Embed text as a normalized float32 vector, loading the model on first use"""
+        import numpy as np
+
+        # A miss is usually followed by store() for the same error
+        if self._last_query is not None and self._last_query[0] == text:
+            return self._last_query[1]
+
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name, device="cpu")
+
+        embedding = np.asarray(self._model.encode(text, normalize_embeddings=True), dtype=np.float32)
+        self._last_query = (text, embedding)
+        return embedding
+
+    def _find_similar(self, query) -> Optional[int]:
+        """Index of the most similar cached entry above the threshold, if any"""
+        if self._embeddings is None or not self._responses:
+            return None
+
+        # Rows and query are normalized, so the dot product is the cosine similarity
+        similarities = self._embeddings[:len(self._responses)] @ query
+        best = int(similarities.argmax())
+        if similarities[best] >= self.threshold:
+            return best
+        return None
+
+    def _add(self, query, response: Dict[str, Any]):
+        """Store a response, replacing the least recently used entry when full"""
+        import numpy as np
+
+        if self._embeddings is None:
+            self._embeddings = np.zeros((self.max_entries, query.shape[0]), dtype=np.float32)
+
+        if len(self._responses) < self.max_entries:
+            index = len(self._responses)
+            self._responses.append(response)
+            self._last_used.append(0)
+        else:
+            index = min(range(len(self._last_used)), key=self._last_used.__getitem__)
+            self._responses[index] = response
+
+        self._embeddings[index] = query
+
+        self._touch(index)
+
+    def _touch(self, index: int):
+        """Mark an entry as most recently used"""
+        self._clock += 1
+        self._last_used[index] = self._clock
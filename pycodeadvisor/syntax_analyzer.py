@@ -1,13 +1,149 @@
 import ast
+import io
+import logging
+import os
+import sys
+import tokenize
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union, TYPE_CHECKING
 
 from pycodeadvisor.models import ErrorEvent
 
+# Subinterpreter pools (one GIL per interpreter) exist on Python 3.14+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:
+    InterpreterPoolExecutor = None
+
+if TYPE_CHECKING:
+    from pycodeadvisor.parse_cache import ParseCache
+
+logger = logging.getLogger(__name__)
+
+# Smaller projects are analyzed in-process, where pool startup would cost more than it saves
+_MIN_FILES_FOR_PARALLEL = 25
+
+# Directory levels at least this wide are scanned by a thread pool
+_MIN_DIRS_FOR_PARALLEL_SCAN = 16
+
+# On free-threaded builds parsing in threads runs truly in parallel without process startup cost
+_GIL_DISABLED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+_PARALLEL_MODES = ("auto", "process", "thread", "interpreter")
+
+# Opening bracket, closing bracket, and the message reported when a line leaves it open
+_BRACKET_PAIRS = (
+    ('(', ')', "'(' was never closed"),
+    ('[', ']', "'[' was never closed"),
+    ('{', '}', "'{' was never closed"),
+)
+
+# Statements that must end with a colon; str.startswith with a tuple checks all of them in C
+_BLOCK_KEYWORDS = ('def ', 'class ', 'if ', 'elif ', 'else', 'for ', 'while ', 'try', 'except', 'finally')
+
+
+def detect_line_patterns(lines: List[str]) -> List[Tuple[int, str]]:
+    """
+    Find likely syntax errors line by line, without building error events
+    
+    Kept free of analyzer state so the scan can run (or be compiled) on its own.
+    
+    Args:
+        lines: Source lines of a file that failed to parse
+        
+    Returns:
+        (line number, message) pairs in line order
+    """
+    findings = []
+    append = findings.append
+    
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        
+        # Check for missing colons
+        if line.startswith(_BLOCK_KEYWORDS) and line[-1] != ':':
+            append((line_num, "expected ':'"))
+        
+        # Check for unclosed parentheses/brackets/braces; the `in` test is cheaper than counting
+        for opening, closing, message in _BRACKET_PAIRS:
+            if opening in line and line.count(opening) > line.count(closing):
+                append((line_num, message))
+        
+        # Check for unclosed quotes
+        if "'" in line and (line.count("'") - line.count("\\'")) % 2 != 0:
+            append((line_num, "unterminated string literal"))
+    
+    return findings
+
+
+def _read_file_bytes(file_path: Union[str, Path]) -> bytes:
+    """Read a whole file with one fstat and one read call, bypassing the buffered IO stack"""
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        stat = os.fstat(fd)
+        if stat.st_size == 0:
+            return b""
+        
+        data = os.read(fd, stat.st_size)
+        # Regular files rarely return short reads, but continue until the known size or EOF
+        while len(data) < stat.st_size:
+            chunk = os.read(fd, stat.st_size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _parse_source(data: bytes, file_path: Union[str, Path]) -> Optional[List[str]]:
+    """Check source bytes with ast.parse, returning the decoded lines only if it failed to parse"""
+    try:
+        ast.parse(data, filename=str(file_path))
+        return None
+    except SyntaxError:
+        pass
+    
+    # Decode like the interpreter does, honouring a BOM or coding cookie
+    try:
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+    except SyntaxError:
+        encoding = 'utf-8'
+    # Undecodable files raise UnicodeDecodeError here and are reported as unreadable
+    return data.decode(encoding).splitlines()
+
+
+def _read_and_parse_file(file_path: str, data: Optional[bytes] = None) -> Tuple[Optional[List[str]], Optional[str]]:
+    """
+    Read and parse a file without any analyzer state, for subinterpreter workers
+    
+    Read failures are returned as a message instead of raised, since exceptions
+    do not cross interpreter boundaries unchanged.
+    
+    Args:
+        file_path: File to analyze
+        data: Content already read by the caller; if None the file is read here
+    
+    Returns:
+        (lines if the file failed to parse, read error message)
+    """
+    try:
+        if data is None:
+            data = _read_file_bytes(file_path)
+        return (_parse_source(data, file_path) if data else None), None
+    except (UnicodeDecodeError, PermissionError, OSError) as e:
+        return None, str(e)
+
 
 class SyntaxAnalyzer:
 
-    def __init__(self, project_path: str, excluded_dirs: Optional[List[str]] = None):
+    def __init__(self, project_path: str, excluded_dirs: Optional[List[str]] = None,
+                 max_workers: Optional[int] = None, parallel: str = "auto",
+                 parse_cache: Optional['ParseCache'] = None):
 
         self.project_path = Path(project_path).resolve()
         if not self.project_path.exists():
@@ -17,125 +153,171 @@ class SyntaxAnalyzer:
             raise ValueError(f"Project path must be a directory, not a file: {project_path}")
         
         # Step 4: Set up excluded directories with sensible defaults
-        self.excluded_dirs = excluded_dirs or ['.git', '__pycache__', 'venv', '.pytest_cache', 'node_modules']
+        self.excluded_dirs = frozenset(excluded_dirs or ['.git', '__pycache__', 'venv', '.pytest_cache', 'node_modules'])
+        # Exclusion decision per directory, so each directory's parents are checked once
+        self._dir_decisions: Dict[str, bool] = {}
+        
+        # Workers for large projects; None picks a default for the backend, 1 disables parallelism
+        self.max_workers = max_workers
+        
+        # "process" parses in worker processes, "thread" in threads of this process, "interpreter"
+        # in subinterpreters (Python 3.14+, else threads; opt-in only); "auto" uses threads when
+        # the GIL is disabled or on Windows, and processes elsewhere
+        if parallel not in _PARALLEL_MODES:
+            raise ValueError(f"Unsupported parallel mode: {parallel}. Supported: {', '.join(_PARALLEL_MODES)}")
+        if parallel == "auto":
+            parallel = "thread" if _GIL_DISABLED or os.name == 'nt' else "process"
+        self.parallel = parallel
+        
+        # Optional store of previous results, so unchanged files are not re-parsed
+        self.parse_cache = parse_cache
+    
+    def __getstate__(self):
+        # Worker processes only analyze files; the cache connection stays in this process
+        state = self.__dict__.copy()
+        state['parse_cache'] = None
+        return state
 
     def should_ignore_directory(self, dir_path: Path) -> bool:
         """Check if directory should be excluded from analysis"""
-
-        if dir_path.name in self.excluded_dirs:
-            return True
+        dir_str = str(dir_path)
+        excluded = self._dir_decisions.get(dir_str)
+        if excluded is None:
+            # A directory is excluded when it or any parent directory is
+            parent = dir_path.parent
+            excluded = dir_path.name in self.excluded_dirs or (
+                parent != dir_path and self.should_ignore_directory(parent))
+            self._dir_decisions[dir_str] = excluded
         
-        # Check all parent directories
-        for parent in dir_path.parents:
-            if parent.name in self.excluded_dirs:
-                return True
-        
-        return False
+        return excluded
 
     def find_python_files(self) -> List[Path]:
         """Discover all Python files in the project directory"""
+        return [Path(file_path) for file_path in self._find_python_paths()]
+    
+    def _find_python_paths(self) -> List[str]:
+        """Discover all Python files as plain path strings, which are cheaper than Path objects"""
+        root = str(self.project_path)
+        scanned: Dict[str, Tuple[List[str], List[str]]] = {}
+        
+        # Scan one directory level at a time; wide levels are listed concurrently,
+        # since scandir and stat release the GIL while waiting on the filesystem
+        executor = None
+        level = [root]
+        try:
+            while level:
+                if executor is None and self.max_workers != 1 and len(level) >= _MIN_DIRS_FOR_PARALLEL_SCAN:
+                    executor = ThreadPoolExecutor(max_workers=self._thread_count())
+                results = executor.map(self._scan_directory, level) if executor else map(self._scan_directory, level)
+                
+                next_level = []
+                for directory, (files, subdirs) in zip(level, results):
+                    scanned[directory] = (files, subdirs)
+                    next_level.extend(subdirs)
+                level = next_level
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        # Emit files in the same depth-first order as a top-down os.walk
         python_files = []
+        pending = [root]
+        while pending:
+            files, subdirs = scanned[pending.pop()]
+            python_files.extend(files)
+            pending.extend(reversed(subdirs))
+        
+        return python_files
+    
+    def _scan_directory(self, directory: str) -> Tuple[List[str], List[str]]:
+        """List a directory's .py files and the subdirectories to descend into"""
+        files = []
+        subdirs = []
         
         try:
-            for file_path in self.project_path.rglob("*.py"):
-                # Check if file is in an excluded directory
-                if self.should_ignore_directory(file_path.parent):
-                    continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
                     
-                # Add file-level validation
-                if self._is_readable_python_file(file_path):
-                    python_files.append(file_path)
-                    
-        except PermissionError as e:
-            print(f"Warning: Cannot access some directories due to permissions: {e}")
+                    if is_dir:
+                        # Prune excluded directories so their subtrees are never traversed;
+                        # like os.walk, symlinked directories are not followed
+                        if entry.name not in self.excluded_dirs and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.py') and self._is_regular_file(entry):
+                        # Unreadable files are reported as FileReadError by analyze_file
+                        files.append(entry.path)
+        except OSError as e:
+            if isinstance(e, PermissionError):
+                logger.warning("Warning: Cannot access some directories due to permissions: %s", e)
         
-        return python_files
-
-    def _is_readable_python_file(self, file_path: Path) -> bool:
-        """Check if file is readable and appears to be a valid Python file"""
+        return files, subdirs
+    
+    def _is_regular_file(self, entry: os.DirEntry) -> bool:
+        """Check that an entry is a regular file, so FIFOs and devices named *.py are never read"""
         try:
-            if not file_path.is_file():
-                return False
-                
-            with file_path.open('r', encoding='utf-8') as f:
-                # Try to read first few bytes to ensure it's not binary
-                f.read(100)
-                
-            return True
-            
-        except (PermissionError, UnicodeDecodeError, OSError):
+            return entry.is_file()
+        except OSError:
             return False
-        
-    def analyze_file(self, file_path: Path) -> List[ErrorEvent]:
-        """Parse single file and return any errors found"""
-        errors = []
-        
+    
+    def analyze_file(self, file_path: Union[str, Path], data: Optional[bytes] = None) -> List[ErrorEvent]:
+        """Parse single file and return any errors found, reading it unless its content is given"""
         try:
-            # Read file content
-            with file_path.open('r', encoding='utf-8') as f:
-                file_content = f.read()
-                lines = file_content.splitlines()
-                
+            lines = self._read_and_parse(file_path, data)
         except (UnicodeDecodeError, PermissionError, OSError) as e:
-            error = ErrorEvent(
-                file_path=str(file_path),
-                line_number=1,
-                error_type="FileReadError",
-                message=f"Cannot read file: {str(e)}"
-            )
-            return [error]
+            return [self._create_read_error(file_path, e)]
         
-        try:
-            # Try AST parsing first
-            ast.parse(file_content, filename=str(file_path))
+        return self._errors_from_parse(file_path, lines)
+    
+    def _read_and_parse(self, file_path: Union[str, Path], data: Optional[bytes] = None) -> Optional[List[str]]:
+        """Read a file and check it with ast.parse, returning its lines only if it failed to parse
+        
+        Content already read by the caller is passed as data. Keeps no state, so it
+        can run in worker threads.
+        """
+        # ast.parse decodes the raw bytes itself, so valid files are never split into lines
+        if data is None:
+            data = _read_file_bytes(file_path)
+        if not data:
+            # Empty files (mostly __init__.py) are always valid
+            return None
+        
+        return _parse_source(data, file_path)
+    
+    def _errors_from_parse(self, file_path: Union[str, Path], lines: Optional[List[str]]) -> List[ErrorEvent]:
+        """Turn a parse result into error events"""
+        if lines is None:
             return []  # No syntax errors found
             
-        except SyntaxError:
-            # AST parsing failed, use pattern-based detection
-            errors = self._detect_multiple_errors(file_path, lines)
+        # AST parsing failed, use pattern-based detection
+        return self._detect_multiple_errors(file_path, lines)
             
-        return errors
+    def _create_read_error(self, file_path: Union[str, Path], error: Union[Exception, str]) -> ErrorEvent:
+        """Create the event reported for a file that cannot be read"""
+        return ErrorEvent(
+            file_path=str(file_path),
+            line_number=1,
+            error_type="FileReadError",
+            message=f"Cannot read file: {str(error)}"
+        )
 
-    def _detect_multiple_errors(self, file_path: Path, lines: List[str]) -> List[ErrorEvent]:
+    def _detect_multiple_errors(self, file_path: Union[str, Path], lines: List[str]) -> List[ErrorEvent]:
         """Detect multiple errors using pattern matching"""
-        errors = []
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            # Check for missing colons
-            if (line.startswith(('def ', 'class ', 'if ', 'elif ', 'else', 'for ', 'while ', 'try', 'except', 'finally')) 
-                and not line.endswith(':')):
-                error = self._create_pattern_error(file_path, line_num, "SyntaxError", 
-                                                "expected ':'", lines, line_num-1)
-                errors.append(error)
-            
-            # Check for unclosed parentheses/brackets
-            if '(' in line and line.count('(') > line.count(')'):
-                error = self._create_pattern_error(file_path, line_num, "SyntaxError", 
-                                                "'(' was never closed", lines, line_num-1)
-                errors.append(error)
-            
-            if '[' in line and line.count('[') > line.count(']'):
-                error = self._create_pattern_error(file_path, line_num, "SyntaxError", 
-                                                "'[' was never closed", lines, line_num-1)
-                errors.append(error)
-            
-            # Check for unclosed quotes
-            single_quotes = line.count("'") - line.count("\\'")
-            double_quotes = line.count('"') - line.count('\\"')
-            
-            if single_quotes % 2 != 0:
-                error = self._create_pattern_error(file_path, line_num, "SyntaxError", 
-                                                "unterminated string literal", lines, line_num-1)
-                errors.append(error)
+        # Errors found in one pass share a detection time and one interned path string
+        timestamp = datetime.now()
+        path_str = sys.intern(str(file_path))
         
-        return errors
+        return [
+            self._create_pattern_error(path_str, line_num, "SyntaxError", message, lines, line_num-1, timestamp)
+            for line_num, message in detect_line_patterns(lines)
+        ]
 
-    def _create_pattern_error(self, file_path: Path, line_number: int, error_type: str, 
-                            message: str, all_lines: List[str], error_index: int) -> ErrorEvent:
+    def _create_pattern_error(self, file_path: Union[Path, str], line_number: int, error_type: str, 
+                            message: str, all_lines: List[str], error_index: int,
+                            timestamp: Optional[datetime] = None) -> ErrorEvent:
         """Create ErrorEvent with context for pattern-detected errors"""
         context_lines = 3
         start_line = max(0, error_index - context_lines)
@@ -150,13 +332,14 @@ class SyntaxAnalyzer:
             error_type=error_type,
             message=message,
             code_context=context,
-            context_start_line=context_start_line
+            context_start_line=context_start_line,
+            timestamp=timestamp
         )
         
     def extract_code_context(self, file_path: Path, error_line: int, lines_before: int = 3, lines_after: int = 3) -> tuple:
         """Read file and extract lines around the error"""
         try:
-            with file_path.open('r', encoding='utf-8') as f:
+            with open(file_path, 'r', encoding='utf-8') as f:
                 all_lines = f.readlines()
                 
             # Calculate context range
@@ -176,29 +359,161 @@ class SyntaxAnalyzer:
         all_errors = []
         
         # Find all Python files
-        python_files = self.find_python_files()
+        python_files = self._find_python_paths()
         
         if not python_files:
-            print(f"No Python files found in {self.project_path}")
+            logger.info("No Python files found in %s", self.project_path)
             return all_errors
         
-        print(f"Analyzing {len(python_files)} Python files...")
+        logger.info("Analyzing %d Python files...", len(python_files))
         
-        # Analyze each file
-        for file_path in python_files:
+        # Analyze each file, across processes for large projects
+        if self.parse_cache is None:
+            results = self._map_files(python_files)
+        else:
+            results = self._map_files_cached(python_files)
+        
+        for file_errors in results:
+            all_errors.extend(file_errors)
+        
+        logger.info("Analysis complete. Found %d errors.", len(all_errors))
+        return all_errors
+    
+    def _map_files(self, python_files: List[str],
+                   sources: Optional[List[Optional[bytes]]] = None) -> List[List[ErrorEvent]]:
+        """
+        Analyze files, in order, using a worker pool when there are enough of them
+        
+        Args:
+            python_files: Files to analyze
+            sources: Content already read for each file, or None where it must be read
+        """
+        if sources is None:
+            sources = [None] * len(python_files)
+        
+        # With a single worker a pool only adds startup and pickling overhead
+        workers = self.max_workers or os.cpu_count() or 1
+        if workers > 1 and len(python_files) >= _MIN_FILES_FOR_PARALLEL:
+            if self.parallel == "interpreter":
+                return self._map_files_interpreters(python_files, sources)
+            if self.parallel == "thread":
+                return self._map_files_threaded(python_files, sources)
+            
             try:
-                file_errors = self.analyze_file(file_path)
-                all_errors.extend(file_errors)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(self._analyze_file_safely, python_files, sources, chunksize=8))
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                # Platforms without working process pools fall back to in-process analysis
+                pass
+        
+        return [self._analyze_file_safely(file_path, data) for file_path, data in zip(python_files, sources)]
+    
+    def _map_files_cached(self, python_files: List[str]) -> List[List[ErrorEvent]]:
+        """Analyze only files whose content changed since the cached run, in order"""
+        results = []
+        changed = []
+        sources = []
+        for index, file_path in enumerate(python_files):
+            file_errors, data = self.parse_cache.get(file_path)
+            results.append(file_errors)
+            if file_errors is None:
+                # Analyze the content the cache already read to hash it
+                changed.append(index)
+                sources.append(data)
+        
+        for index, file_errors in zip(changed, self._map_files([python_files[index] for index in changed], sources)):
+            results[index] = file_errors
+            self.parse_cache.put(python_files[index], file_errors)
+        
+        self.parse_cache.flush(python_files)
+        return results
+    
+    def _thread_count(self) -> int:
+        """Number of worker threads for I/O-heavy work"""
+        return self.max_workers or min(32, (os.cpu_count() or 1) * 2)
+    
+    def _map_files_threaded(self, python_files: List[str], sources: List[Optional[bytes]]) -> List[List[ErrorEvent]]:
+        """Read and parse files in a thread pool, building error events on this thread"""
+        with ThreadPoolExecutor(max_workers=self._thread_count()) as executor:
+            futures = [executor.submit(self._read_and_parse, file_path, data)
+                       for file_path, data in zip(python_files, sources)]
+            
+            results = []
+            for file_path, future in zip(python_files, futures):
+                try:
+                    lines = future.result()
+                except (UnicodeDecodeError, PermissionError, OSError) as e:
+                    results.append([self._create_read_error(file_path, e)])
+                    continue
+                except Exception as e:
+                    results.append([self._create_analysis_error(file_path, e)])
+                    continue
+                
+                results.append(self._analyze_parsed_safely(file_path, lines))
+            
+            return results
+    
+    def _map_files_interpreters(self, python_files: List[str], sources: List[Optional[bytes]]) -> List[List[ErrorEvent]]:
+        """Read and parse files in subinterpreters, building error events in this interpreter"""
+        if InterpreterPoolExecutor is None:
+            # Before Python 3.14 threads are the closest in-process alternative
+            return self._map_files_threaded(python_files, sources)
+        
+        try:
+            with InterpreterPoolExecutor(max_workers=self.max_workers or os.cpu_count()) as executor:
+                futures = [executor.submit(_read_and_parse_file, file_path, data)
+                           for file_path, data in zip(python_files, sources)]
                 
-            except Exception as e:
-                # Create error event for unexpected analysis failures
-                error = ErrorEvent(
-                    file_path=str(file_path),
-                    line_number=1,
-                    error_type="AnalysisError",
-                    message=f"Unexpected error during analysis: {str(e)}"
-                )
-                all_errors.append(error)
-        
-        print(f"Analysis complete. Found {len(all_errors)} errors.")
-        return all_errors
\ No newline at end of file
+                # Read errors come back as values, so a failing first call means the worker
+                # itself is broken (e.g. it cannot import or unpickle the task)
+                try:
+                    futures[0].result()
+                except Exception as e:
+                    for future in futures:
+                        future.cancel()
+                    raise BrokenExecutor(str(e)) from e
+                
+                results = []
+                for file_path, future in zip(python_files, futures):
+                    try:
+                        lines, read_error = future.result()
+                    except BrokenExecutor:
+                        raise
+                    except Exception as e:
+                        results.append([self._create_analysis_error(file_path, e)])
+                        continue
+                    
+                    if read_error is not None:
+                        results.append([self._create_read_error(file_path, read_error)])
+                    else:
+                        results.append(self._analyze_parsed_safely(file_path, lines))
+                
+                return results
+        except BrokenExecutor:
+            # Interpreters that cannot start or run the task (e.g. an extension without
+            # subinterpreter support) fall back to threads
+            logger.debug("Subinterpreter backend unavailable, parsing in threads", exc_info=True)
+            return self._map_files_threaded(python_files, sources)
+    
+    def _analyze_file_safely(self, file_path: Union[str, Path], data: Optional[bytes] = None) -> List[ErrorEvent]:
+        """Analyze a file, reporting unexpected failures as an AnalysisError event"""
+        try:
+            return self.analyze_file(file_path, data)
+        except Exception as e:
+            return [self._create_analysis_error(file_path, e)]
+            
+    def _analyze_parsed_safely(self, file_path: Union[str, Path], lines: Optional[List[str]]) -> List[ErrorEvent]:
+        """Build error events for a parsed file, reporting unexpected failures as an AnalysisError event"""
+        try:
+            return self._errors_from_parse(file_path, lines)
+        except Exception as e:
+            return [self._create_analysis_error(file_path, e)]
+    
+    def _create_analysis_error(self, file_path: Union[str, Path], error: Exception) -> ErrorEvent:
+        """Create error event for unexpected analysis failures"""
+        return ErrorEvent(
+            file_path=str(file_path),
+            line_number=1,
+            error_type="AnalysisError",
+            message=f"Unexpected error during analysis: {str(error)}"
+        )